@@ -6,11 +6,36 @@ This module provides the main entry point and package-level exports.
 
 import logging
 from importlib.metadata import version
+from typing import TYPE_CHECKING, Any
 
-from .main import run
+if TYPE_CHECKING:
+    from .main import run
 
 __all__ = ["run", "__version__"]
 __version__ = version("mcp-ollama-python")
 
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import run on first access (PEP 562).
+
+    Keeps importing a submodule such as mcp_ollama_python.scripts or
+    mcp_ollama_python.security from loading the whole MCP stack.
+
+    Args:
+        name: Attribute being looked up
+
+    Returns:
+        The requested attribute
+
+    Raises:
+        AttributeError: If the attribute does not exist
+    """
+    if name == "run":
+        from .main import run
+
+        return run
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
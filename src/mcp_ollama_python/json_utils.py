@@ -0,0 +1,62 @@
+"""
+JSON helpers that prefer orjson when it is installed
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps_indented(content: Any) -> str:
+    """
+    Serialize content as 2-space indented JSON.
+
+    Uses orjson when installed and falls back to the stdlib for values orjson
+    rejects (e.g. integers wider than 64 bits) or when it is unavailable.
+
+    Args:
+        content: JSON-serializable value
+
+    Returns:
+        Indented JSON text
+
+    Raises:
+        TypeError: If content is not JSON serializable
+        ValueError: If content contains a circular reference
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                content, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(content, indent=2)
+
+
+def loads(text: Union[str, bytes]) -> Any:
+    """
+    Parse JSON text, preferring orjson when available.
+
+    Input orjson rejects but the stdlib accepts (NaN/Infinity, lone
+    surrogates) is retried with json.loads.
+
+    Args:
+        text: JSON document as str or UTF-8 bytes
+
+    Returns:
+        Parsed value
+
+    Raises:
+        json.JSONDecodeError: If text is not valid JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
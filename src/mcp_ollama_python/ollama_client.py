@@ -17,9 +17,11 @@ try:
         NetworkError,
     )
     from mcp_ollama_python.security import validate_model_name, validate_ollama_host
+    from mcp_ollama_python.json_utils import loads
 except ImportError:
     from .models import GenerationOptions, ChatMessage, Tool, OllamaError, NetworkError
     from .security import validate_model_name, validate_ollama_host
+    from .json_utils import loads
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -28,6 +30,19 @@ logger = logging.getLogger(__name__)
 DEFAULT_HOST = "http://127.0.0.1:11434"
 DEFAULT_TIMEOUT = 300.0  # 5 minutes
 
+# API endpoints
+API_TAGS = "/api/tags"
+API_SHOW = "/api/show"
+API_PULL = "/api/pull"
+API_PUSH = "/api/push"
+API_COPY = "/api/copy"
+API_DELETE = "/api/delete"
+API_CREATE = "/api/create"
+API_GENERATE = "/api/generate"
+API_CHAT = "/api/chat"
+API_EMBED = "/api/embed"
+API_PS = "/api/ps"
+
 
 class OllamaClient:
     """
@@ -123,15 +138,15 @@ class OllamaClient:
             logger.error("Invalid JSON in response: %s", e)
             raise OllamaError(f"Invalid JSON response: {e}", cause=e) from e
 
-    async def _get(self, endpoint: str) -> Dict[str, Any]:
+    async def _get_raw(self, endpoint: str) -> bytes:
         """
-        Make a GET request to Ollama API.
+        Make a GET request to Ollama API and return the body unparsed.
 
         Args:
             endpoint: API endpoint path
 
         Returns:
-            JSON response as dictionary
+            Raw JSON response body (b"{}" for empty responses)
 
         Raises:
             OllamaError: If API returns error status
@@ -140,7 +155,8 @@ class OllamaClient:
         logger.debug("GET %s", endpoint)
         try:
             response = await self.client.get(endpoint)
-            return self._handle_response(response)
+            response.raise_for_status()
+            return response.content or b"{}"
         except httpx.HTTPStatusError as e:
             logger.error(
                 "HTTP error on GET %s: %s - %s",
@@ -159,6 +175,27 @@ class OllamaClient:
             logger.error("Unexpected error on GET %s: %s", endpoint, e)
             raise NetworkError(f"Unexpected error: {str(e)}", cause=e) from e
 
+    async def _get(self, endpoint: str) -> Dict[str, Any]:
+        """
+        Make a GET request to Ollama API.
+
+        Args:
+            endpoint: API endpoint path
+
+        Returns:
+            JSON response as dictionary
+
+        Raises:
+            OllamaError: If API returns error status or invalid JSON
+            NetworkError: If network request fails
+        """
+        body = await self._get_raw(endpoint)
+        try:
+            return loads(body)
+        except ValueError as e:
+            logger.error("Invalid JSON in response: %s", e)
+            raise OllamaError(f"Invalid JSON response: {e}", cause=e) from e
+
     async def _post(self, endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Make a POST request to Ollama API.
@@ -244,7 +281,20 @@ class OllamaClient:
             OllamaError: If API returns error
             NetworkError: If connection fails
         """
-        return await self._get("/api/tags")
+        return await self._get(API_TAGS)
+
+    async def list_raw(self) -> bytes:
+        """
+        List all available models as the unparsed JSON response body.
+
+        Returns:
+            Raw /api/tags response body
+
+        Raises:
+            OllamaError: If API returns error
+            NetworkError: If connection fails
+        """
+        return await self._get_raw(API_TAGS)
 
     async def show(self, model: str) -> Dict[str, Any]:
         """
@@ -262,7 +312,7 @@ class OllamaClient:
             NetworkError: If connection fails
         """
         validate_model_name(model)
-        return await self._post("/api/show", {"name": model})
+        return await self._post(API_SHOW, {"name": model})
 
     async def pull(self, model: str) -> Dict[str, Any]:
         """
@@ -280,7 +330,7 @@ class OllamaClient:
             NetworkError: If connection fails
         """
         validate_model_name(model)
-        return await self._post("/api/pull", {"name": model, "stream": False})
+        return await self._post(API_PULL, {"name": model, "stream": False})
 
     async def push(self, model: str) -> Dict[str, Any]:
         """
@@ -298,7 +348,7 @@ class OllamaClient:
             NetworkError: If connection fails
         """
         validate_model_name(model)
-        return await self._post("/api/push", {"name": model, "stream": False})
+        return await self._post(API_PUSH, {"name": model, "stream": False})
 
     async def copy(self, source: str, destination: str) -> Dict[str, Any]:
         """
@@ -319,7 +369,7 @@ class OllamaClient:
         validate_model_name(source)
         validate_model_name(destination)
         return await self._post(
-            "/api/copy", {"source": source, "destination": destination}
+            API_COPY, {"source": source, "destination": destination}
         )
 
     async def delete(self, model: str) -> Dict[str, Any]:
@@ -338,7 +388,7 @@ class OllamaClient:
             NetworkError: If connection fails
         """
         validate_model_name(model)
-        return await self._delete("/api/delete", {"name": model})
+        return await self._delete(API_DELETE, {"name": model})
 
     async def create(
         self, name: str, modelfile: str, stream: bool = False
@@ -364,7 +414,7 @@ class OllamaClient:
         data = {"name": name, "modelfile": modelfile}
         if stream:
             data["stream"] = True
-        return await self._post("/api/create", data)
+        return await self._post(API_CREATE, data)
 
     async def generate(
         self,
@@ -392,10 +442,13 @@ class OllamaClient:
         """
         validate_model_name(model)
         self._validate_non_empty_string(prompt, "prompt")
-        data = {"model": model, "prompt": prompt, "stream": stream}
-        if options:
-            data["options"] = options.model_dump(exclude_unset=True)
-        return await self._post("/api/generate", data)
+        data = {
+            "model": model,
+            "prompt": prompt,
+            "stream": stream,
+            **({"options": options.model_dump(exclude_unset=True)} if options else {}),
+        }
+        return await self._post(API_GENERATE, data)
 
     async def chat(
         self,
@@ -430,12 +483,10 @@ class OllamaClient:
             "model": model,
             "messages": [msg.model_dump(exclude_unset=True) for msg in messages],
             "stream": stream,
+            **({"tools": [tool.model_dump() for tool in tools]} if tools else {}),
+            **({"options": options.model_dump(exclude_unset=True)} if options else {}),
         }
-        if tools:
-            data["tools"] = [tool.model_dump() for tool in tools]
-        if options:
-            data["options"] = options.model_dump(exclude_unset=True)
-        return await self._post("/api/chat", data)
+        return await self._post(API_CHAT, data)
 
     async def embed(
         self, model: str, input_text: Union[str, List[str]]
@@ -465,7 +516,7 @@ class OllamaClient:
                 self._validate_non_empty_string(text, f"input_text[{i}]")
         else:
             raise ValueError("input_text must be a string or list of strings")
-        return await self._post("/api/embed", {"model": model, "input": input_text})
+        return await self._post(API_EMBED, {"model": model, "input": input_text})
 
     async def ps(self) -> Dict[str, Any]:
         """
@@ -478,4 +529,17 @@ class OllamaClient:
             OllamaError: If API returns error
             NetworkError: If connection fails
         """
-        return await self._get("/api/ps")
+        return await self._get(API_PS)
+
+    async def ps_raw(self) -> bytes:
+        """
+        List currently running models as the unparsed JSON response body.
+
+        Returns:
+            Raw /api/ps response body
+
+        Raises:
+            OllamaError: If API returns error
+            NetworkError: If connection fails
+        """
+        return await self._get_raw(API_PS)
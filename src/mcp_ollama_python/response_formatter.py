@@ -2,13 +2,17 @@
 Response formatting utilities
 """
 
+import functools
 import json
 import logging
-from typing import Any, Dict, List, Optional, Set
+import operator
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 try:
+    from mcp_ollama_python.json_utils import dumps_indented, loads
     from mcp_ollama_python.models import ResponseFormat
 except ImportError:
+    from .json_utils import dumps_indented, loads
     from .models import ResponseFormat
 
 # Configure logging
@@ -17,15 +21,41 @@ logger = logging.getLogger(__name__)
 # Constants
 MAX_RECURSION_DEPTH = 100
 MAX_TABLE_CELL_LENGTH = 50
+_ELLIPSIS = "..."
+_CELL_BUDGET = MAX_TABLE_CELL_LENGTH - len(_ELLIPSIS)
+FORMAT_CACHE_SIZE = 128
+FORMAT_CACHE_MAX_CHARS = 65_536  # larger payloads are formatted uncached
 
+# json_to_markdown work item: literal output text or a (data, indent, depth) node
+_WorkItem = Union[str, Tuple[Any, str, int]]
 
-def format_response(content: Any, format: ResponseFormat) -> str:
+# json_to_markdown type handler: (data, indent, depth, seen, out, stack)
+_Handler = Callable[
+    [Any, str, int, Optional[Set[int]], List[str], List[_WorkItem]], None
+]
+
+# Exact types of JSON scalars, used to skip isinstance() in hot paths
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# Single-pass translation table for Markdown special characters
+_MD_ESCAPE = str.maketrans({c: "\\" + c for c in "\\|*_`[]#"})
+
+# Object keys display underscores as spaces and escape everything else
+_KEY_ESCAPE = str.maketrans({**{c: "\\" + c for c in "\\|*`[]#"}, "_": " "})
+
+
+def format_response(
+    content: Any, format: ResponseFormat, *, validated: bool = False
+) -> str:
     """
     Format response content based on the specified format.
 
     Args:
         content: Content to format (dict, list, or string)
         format: Desired output format (JSON or MARKDOWN)
+        validated: Caller guarantees string content is already valid JSON
+            (e.g. produced by our own serializer); it is returned unchanged
+            in JSON format without validation
 
     Returns:
         Formatted string
@@ -33,6 +63,18 @@ def format_response(content: Any, format: ResponseFormat) -> str:
     Raises:
         ValueError: If format is not a valid ResponseFormat
     """
+    # Exact (type, format) pairs dispatch straight to a specialised handler;
+    # subclasses, plain-string formats and invalid formats take the generic
+    # path below
+    try:
+        handler = _FORMAT_DISPATCH.get((type(content), format))
+    except TypeError:  # unhashable format, rejected below
+        handler = None
+    if handler is not None:
+        if validated and handler is _format_str_json:
+            return content
+        return handler(content)
+
     # Validate format parameter
     if format not in [ResponseFormat.JSON, ResponseFormat.MARKDOWN]:
         raise ValueError(f"Unsupported format: {format}")
@@ -40,42 +82,18 @@ def format_response(content: Any, format: ResponseFormat) -> str:
     # Handle dict/list input
     if isinstance(content, (dict, list)):
         if format == ResponseFormat.JSON:
-            try:
-                return json.dumps(content, indent=2)
-            except (TypeError, ValueError) as e:
-                logger.error(f"Failed to serialize content to JSON: {e}")
-                return json.dumps(
-                    {"error": "Failed to serialize content", "details": str(e)}
-                )
+            return _format_container_json(content)
         else:
             # Format as markdown
             return json_to_markdown(content)
 
     # Handle string input
     if isinstance(content, str):
+        if validated and format == ResponseFormat.JSON:
+            return content
         if format == ResponseFormat.JSON:
-            # For JSON format, validate and potentially wrap errors
-            try:
-                # Try to parse to validate it's valid JSON
-                json.loads(content)
-                return content
-            except json.JSONDecodeError as e:
-                # If not valid JSON, wrap in error object
-                logger.warning(f"Invalid JSON content: {e}")
-                return json.dumps(
-                    {
-                        "error": "Invalid JSON content",
-                        "raw_content": content,
-                    }
-                )
-        else:
-            # Format as markdown
-            try:
-                data = json.loads(content)
-                return json_to_markdown(data)
-            except json.JSONDecodeError:
-                # If not valid JSON, return as-is (it's plain text)
-                return content
+            return _format_str_json(content)
+        return _format_str_markdown(content)
 
     # Handle other types (int, float, bool, None)
     if format == ResponseFormat.JSON:
@@ -84,8 +102,70 @@ def format_response(content: Any, format: ResponseFormat) -> str:
         return str(content)
 
 
+def _format_container_json(content: Any) -> str:
+    """Serialize a dict/list as indented JSON, reporting unserializable data."""
+    try:
+        return dumps_indented(content)
+    except (TypeError, ValueError) as e:
+        logger.error(f"Failed to serialize content to JSON: {e}")
+        return dumps_indented(
+            {"error": "Failed to serialize content", "details": str(e)}
+        )
+
+
+def _format_str_json(content: str) -> str:
+    """Validate string content as JSON (repeat payloads served from cache)."""
+    if len(content) <= FORMAT_CACHE_MAX_CHARS:
+        return _format_str_cached(content, ResponseFormat.JSON)
+    return _format_str(content, ResponseFormat.JSON)
+
+
+def _format_str_markdown(content: str) -> str:
+    """Render string content as markdown (repeat payloads served from cache)."""
+    if len(content) <= FORMAT_CACHE_MAX_CHARS:
+        return _format_str_cached(content, ResponseFormat.MARKDOWN)
+    return _format_str(content, ResponseFormat.MARKDOWN)
+
+
+def _format_str(content: str, format: ResponseFormat) -> str:
+    """Format string content (serialized JSON or plain text)."""
+    if format == ResponseFormat.JSON:
+        # For JSON format, validate and potentially wrap errors
+        try:
+            # Try to parse to validate it's valid JSON
+            loads(content)
+            return content
+        except json.JSONDecodeError as e:
+            # If not valid JSON, wrap in error object
+            logger.warning(f"Invalid JSON content: {e}")
+            return json.dumps(
+                {
+                    "error": "Invalid JSON content",
+                    "raw_content": content,
+                }
+            )
+    else:
+        # Format as markdown
+        try:
+            data = loads(content)
+            # Freshly parsed JSON cannot contain cycles
+            return json_to_markdown(data, check_cycles=False)
+        except json.JSONDecodeError:
+            # If not valid JSON, return as-is (it's plain text)
+            return content
+
+
+# Keyed on the string itself: CPython caches str hashes, so repeat lookups are
+# cheap and, unlike a digest, the key cannot collide
+_format_str_cached = functools.lru_cache(maxsize=FORMAT_CACHE_SIZE)(_format_str)
+
+
 def json_to_markdown(
-    data: Any, indent: str = "", seen: Optional[Set[int]] = None, depth: int = 0
+    data: Any,
+    indent: str = "",
+    seen: Optional[Set[int]] = None,
+    depth: int = 0,
+    check_cycles: bool = True,
 ) -> str:
     """
     Convert JSON data to markdown format.
@@ -95,116 +175,234 @@ def json_to_markdown(
         indent: Indentation string for nested elements
         seen: Set of object IDs to detect circular references
         depth: Current recursion depth
+        check_cycles: Track visited objects to detect circular references.
+            Can be disabled for data fresh from a JSON parser, which is
+            always acyclic.
 
     Returns:
         Markdown-formatted string
 
     Note:
         Circular references are handled gracefully by returning a placeholder.
-        Maximum recursion depth is enforced to prevent stack overflow.
+        Maximum nesting depth is enforced; the walk uses an explicit stack
+        rather than Python recursion.
     """
     # Initialize seen set on first call
-    if seen is None:
+    if not check_cycles:
+        seen = None
+    elif seen is None:
         seen = set()
 
-    # Check recursion depth
-    if depth > MAX_RECURSION_DEPTH:
-        logger.warning(f"Maximum recursion depth ({MAX_RECURSION_DEPTH}) exceeded")
-        return f"{indent}_max depth exceeded_"
-
-    # Handle null/undefined
-    if data is None:
-        return f"{indent}_null_"
+    out: List[str] = []
+    _emit(data, indent, depth, seen, out)
+    return "".join(out)
 
-    # Handle primitives
-    if not isinstance(data, (dict, list)):
-        return f"{indent}{escape_markdown(str(data))}"
 
-    # Check for circular references
-    data_id = id(data)
-    if data_id in seen:
-        return f"{indent}_circular reference_"
+def _emit(
+    data: Any, indent: str, depth: int, seen: Optional[Set[int]], out: List[str]
+) -> None:
+    """
+    Append the markdown rendering of data to out as flat string fragments.
 
-    # Add to seen set (keep it there to detect all references, not just circular ones)
-    seen.add(data_id)
+    seen is the set of visited object IDs, or None to skip cycle detection.
 
-    try:
-        # Handle arrays
-        if isinstance(data, list):
-            if len(data) == 0:
-                return f"{indent}_empty array_"
-
-            # Check if array of objects with consistent keys (table format)
-            if isinstance(data[0], dict) and data[0] is not None:
-                return array_to_markdown_table(data, indent, seen, depth)
-
-            # Array of primitives or mixed types
-            return "\n".join(
-                f"{indent}- {json_to_markdown(item, '', seen, depth + 1)}"
-                for item in data
+    Nested containers never produce intermediate strings; every fragment
+    goes straight into the caller's buffer.
+    """
+    # Work items are either literal text or (data, indent, depth) nodes
+    stack: List[_WorkItem] = [(data, indent, depth)]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            out.append(item)
+            continue
+
+        node, node_indent, node_depth = item
+
+        # Check nesting depth
+        if node_depth > MAX_RECURSION_DEPTH:
+            logger.warning(f"Maximum recursion depth ({MAX_RECURSION_DEPTH}) exceeded")
+            out.append(f"{node_indent}_max depth exceeded_")
+            continue
+
+        handler: Optional[_Handler] = _MD_HANDLERS.get(type(node))
+        if handler is None:
+            # Subclasses of dict/list still get structured output
+            if isinstance(node, dict):
+                handler = _md_dict
+            elif isinstance(node, list):
+                handler = _md_list
+            else:
+                handler = _md_primitive
+        handler(node, node_indent, node_depth, seen, out, stack)
+
+
+def _md_null(
+    data: None,
+    indent: str,
+    depth: int,
+    seen: Optional[Set[int]],
+    out: List[str],
+    stack: List[_WorkItem],
+) -> None:
+    """Render a null value."""
+    out.append(f"{indent}_null_")
+
+
+def _md_primitive(
+    data: Any,
+    indent: str,
+    depth: int,
+    seen: Optional[Set[int]],
+    out: List[str],
+    stack: List[_WorkItem],
+) -> None:
+    """Render a scalar value (string, number, boolean)."""
+    out.append(f"{indent}{str(data).translate(_MD_ESCAPE)}")
+
+
+def _md_list(
+    data: List[Any],
+    indent: str,
+    depth: int,
+    seen: Optional[Set[int]],
+    out: List[str],
+    stack: List[_WorkItem],
+) -> None:
+    """Render an array as a bullet list or, for arrays of objects, a table."""
+    # Check for circular references
+    if seen is not None:
+        data_id = id(data)
+        if data_id in seen:
+            out.append(f"{indent}_circular reference_")
+            return
+
+        # Add to seen set (keep it there to detect all references, not just circular ones)
+        seen.add(data_id)
+
+    if len(data) == 0:
+        out.append(f"{indent}_empty array_")
+        return
+
+    # Check if array of objects with consistent keys (table format)
+    first = data[0]
+    if type(first) is dict or isinstance(first, dict):
+        out.append(array_to_markdown_table(data, indent, seen, depth))
+        return
+
+    # Array of primitives or mixed types; push in reverse to preserve order
+    prefix = f"{indent}- "
+    child_depth = depth + 1
+    for i in range(len(data) - 1, -1, -1):
+        stack.append((data[i], "", child_depth))
+        stack.append(prefix)
+        if i:
+            stack.append("\n")
+
+
+def _md_dict(
+    data: Dict[str, Any],
+    indent: str,
+    depth: int,
+    seen: Optional[Set[int]],
+    out: List[str],
+    stack: List[_WorkItem],
+) -> None:
+    """Render an object as bold key/value lines."""
+    # Check for circular references
+    if seen is not None:
+        data_id = id(data)
+        if data_id in seen:
+            out.append(f"{indent}_circular reference_")
+            return
+
+        # Add to seen set (keep it there to detect all references, not just circular ones)
+        seen.add(data_id)
+
+    if not data:
+        out.append(f"{indent}_empty object_")
+        return
+
+    # Push in reverse to preserve order
+    child_indent = indent + "  "
+    child_depth = depth + 1
+    key_prefix = indent + "**"
+    first = True
+    for key, value in reversed(data.items()):
+        if first:
+            first = False
+        else:
+            stack.append("\n")
+        formatted_key = key.translate(_KEY_ESCAPE)
+        # Exact-type checks first; JSON scalars skip the subclass-aware isinstance
+        t = type(value)
+        if (
+            t is dict
+            or t is list
+            or (t not in _SCALAR_TYPES and isinstance(value, (dict, list)))
+        ):
+            stack.append((value, child_indent, child_depth))
+            stack.append(f"{key_prefix}{formatted_key}:**\n")
+        else:
+            stack.append(
+                f"{key_prefix}{formatted_key}:** {str(value).translate(_MD_ESCAPE)}"
             )
 
-        # Handle objects
-        entries = list(data.items())
-        if len(entries) == 0:
-            return f"{indent}_empty object_"
 
-        return "\n".join(
-            _format_object_entry(key, value, indent, seen, depth)
-            for key, value in entries
-        )
-    finally:
-        # Do not remove from seen set after processing
-        pass
+# Exact-type dispatch for json_to_markdown; anything else is a primitive
+_MD_HANDLERS: Dict[type, _Handler] = {
+    dict: _md_dict,
+    list: _md_list,
+    type(None): _md_null,
+}
 
 
-def escape_markdown(text: str) -> str:
+def escape_markdown(text: Any) -> str:
     """
     Escape special Markdown characters to prevent formatting issues.
 
     Args:
-        text: Text to escape
+        text: Text to escape (non-strings are returned as str(text))
 
     Returns:
         Escaped text safe for Markdown rendering
+
+    Note:
+        Internal hot paths that already hold a str translate with
+        _MD_ESCAPE directly instead of calling this wrapper.
     """
-    if not isinstance(text, str):
-        return str(text)
+    if isinstance(text, str):
+        return text.translate(_MD_ESCAPE)
+    return str(text)
 
-    # Escape backslash first to prevent double-escaping
-    text = text.replace("\\", "\\\\")
 
-    # Escape other Markdown special characters
-    for char in ["|", "*", "_", "`", "[", "]", "#"]:
-        text = text.replace(char, f"\\{char}")
+@functools.lru_cache(maxsize=4096)
+def _escape_cached(text: str) -> str:
+    """
+    Memoized escape_markdown for repetitive table text.
 
-    return text
+    Only called with at most MAX_TABLE_CELL_LENGTH characters, so the cache
+    never holds on to large values.
+    """
+    return text.translate(_MD_ESCAPE)
 
 
-def _format_object_entry(
-    key: str, value: Any, indent: str, seen: Set[int], depth: int
-) -> str:
-    """
-    Format a single key-value pair in an object.
+def _escape_header(text: str) -> str:
+    """Escape a table header, memoizing only headers short enough to keep."""
+    if len(text) > MAX_TABLE_CELL_LENGTH:
+        return text.translate(_MD_ESCAPE)
+    return _escape_cached(text)
 
-    Args:
-        key: Object key
-        value: Object value
-        indent: Current indentation
-        seen: Set of seen object IDs
-        depth: Current recursion depth
 
-    Returns:
-        Formatted key-value pair
-    """
-    formatted_key = escape_markdown(key.replace("_", " "))
-    if isinstance(value, (dict, list)) and value is not None:
-        return f"{indent}**{formatted_key}:**\n{json_to_markdown(value, indent + '  ', seen, depth + 1)}"
-    return f"{indent}**{formatted_key}:** {escape_markdown(str(value))}"
+def _cellize(text: str) -> str:
+    """Truncate a table cell for display and escape it."""
+    if len(text) > MAX_TABLE_CELL_LENGTH:
+        text = text[:_CELL_BUDGET] + _ELLIPSIS
+    return _escape_cached(text)
 
 
 def array_to_markdown_table(
-    data: List[Dict[str, Any]],
+    data: List[Any],
     indent: str = "",
     seen: Optional[Set[int]] = None,
     depth: int = 0,
@@ -213,7 +411,7 @@ def array_to_markdown_table(
     Convert array of objects to markdown table format.
 
     Args:
-        data: List of dictionaries to convert
+        data: List of dictionaries to convert (non-dict rows are skipped)
         indent: Indentation string
         seen: Set of seen object IDs
         depth: Current recursion depth
@@ -224,36 +422,55 @@ def array_to_markdown_table(
     if not data or not isinstance(data[0], dict):
         return json_to_markdown(data, indent, seen, depth)
 
-    # Get all unique keys from all objects, preserving insertion order
-    all_keys = dict.fromkeys(
-        key for item in data if isinstance(item, dict) for key in item
-    )
+    # Single pass: keep object rows (others cannot be tabulated) and collect
+    # all unique keys, preserving insertion order
+    all_keys: Dict[Any, None] = {}
+    dict_items: List[Dict[str, Any]] = []
+    for item in data:
+        if type(item) is dict or isinstance(item, dict):
+            dict_items.append(item)
+            for key in item:
+                if key not in all_keys:
+                    all_keys[key] = None
 
     if not all_keys:
         return f"{indent}_empty array_"
 
-    headers = [escape_markdown(str(h)) for h in all_keys]
-    rows = []
+    headers = [_escape_header(str(h)) for h in all_keys]
+    rows: List[str] = []
 
     # Add header row
     header_row = "| " + " | ".join(headers) + " |"
-    separator_row = "|" + "|".join("---" for _ in headers) + "|"
+    separator_row = "|" + "|".join(["---"] * len(headers)) + "|"
     rows.extend([header_row, separator_row])
 
-    # Add data rows
-    for item in data:
-        if isinstance(item, dict):
-            row_values = []
-            for header in all_keys:
-                value = item.get(header, "")
-                value_str = str(value)
+    # Add data rows (module global bound to a local for the inner loop)
+    cellize = _cellize
+    # Place values by column slot so only keys present in a row are visited;
+    # missing cells stay empty
+    header_index = {key: i for i, key in enumerate(all_keys)}
+    width = len(header_index)
+    # Every row key is a header, so a row with ``width`` keys has all of them
+    # and can be read in column order with one C-level lookup
+    getter = operator.itemgetter(*all_keys) if width > 1 else None
+    for item in dict_items:
+        if getter is not None and len(item) == width:
+            row_values = [cellize(str(value)) for value in getter(item)]
+        else:
+            row_values = [""] * width
+            for key, value in item.items():
+                row_values[header_index[key]] = cellize(str(value))
+        rows.append("| " + " | ".join(row_values) + " |")
 
-                # Truncate long values for table display
-                if len(value_str) > MAX_TABLE_CELL_LENGTH:
-                    value_str = value_str[: MAX_TABLE_CELL_LENGTH - 3] + "..."
+    return "\n".join(rows)
 
-                # Escape markdown characters
-                row_values.append(escape_markdown(value_str))
-            rows.append("| " + " | ".join(row_values) + " |")
 
-    return "\n".join(rows)
+# format_response fast path: (exact content type, format) -> handler
+_FORMAT_DISPATCH: Dict[Tuple[type, ResponseFormat], Callable[[Any], str]] = {
+    (dict, ResponseFormat.JSON): _format_container_json,
+    (list, ResponseFormat.JSON): _format_container_json,
+    (dict, ResponseFormat.MARKDOWN): json_to_markdown,
+    (list, ResponseFormat.MARKDOWN): json_to_markdown,
+    (str, ResponseFormat.JSON): _format_str_json,
+    (str, ResponseFormat.MARKDOWN): _format_str_markdown,
+}
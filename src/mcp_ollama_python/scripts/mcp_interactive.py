@@ -6,22 +6,56 @@ Provides a menu-driven interface to manage and interact with the Ollama MCP Serv
 Package-compatible version — uses ~/.mcp-ollama-python/ for data storage.
 """
 
-import asyncio
+import atexit
+import codecs
 import json
 import logging
 import os
 from pathlib import Path
+import shutil
 import signal
+import socket
+import stat
 import subprocess
 import sys
 import time
-from typing import Dict, Optional
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Callable,
+    Coroutine,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+from urllib.parse import urlsplit
+
+from mcp_ollama_python import json_utils
+from mcp_ollama_python.scripts.process_utils import wait_for_exit
+from mcp_ollama_python.security import (
+    is_local_hostname,
+    validate_env_var_key,
+    validate_ollama_host,
+)
+
+# asyncio, psutil and the client/server modules are imported where they are
+# used so that starting the menu (or only editing env vars) does not pay for
+# them
+if TYPE_CHECKING:
+    import asyncio
 
-import psutil
+    import httpx
+    import psutil
 
-from mcp_ollama_python.ollama_client import OllamaClient
-from mcp_ollama_python.server import OllamaMCPServer
-from mcp_ollama_python.security import validate_env_var_key, validate_ollama_host
+    from mcp_ollama_python.autoloader import ToolRegistry
+    from mcp_ollama_python.ollama_client import OllamaClient
+    from mcp_ollama_python.server import OllamaMCPServer
+
+T = TypeVar("T")
 
 # Data directory in user home
 DATA_DIR = Path.home() / ".mcp-ollama-python"
@@ -31,6 +65,72 @@ PID_FILE = TMP_DIR / ".mcp_ollama_server.pid"
 ENV_VARS_FILE = TMP_DIR / ".mcp_env_vars.json"
 LOG_FILE = LOGS_DIR / "mcp_ollama_server.log"
 ERROR_LOG_FILE = LOGS_DIR / "mcp_ollama_server_error.log"
+# The previous run's logs, kept by start_server instead of truncating them
+PREVIOUS_LOG_FILE = LOGS_DIR / "mcp_ollama_server.log.1"
+PREVIOUS_ERROR_LOG_FILE = LOGS_DIR / "mcp_ollama_server_error.log.1"
+
+# Main menu and environment submenu, rendered once and written with a single
+# call
+_MENU_TEXT = "\n".join(
+    [
+        "",
+        "=" * 60,
+        "OLLAMA MCP SERVER - INTERACTIVE MANAGER",
+        "=" * 60,
+        "1. Check MCP server status",
+        "2. Start server",
+        "3. Stop server",
+        "4. View server logs",
+        "5. List server commands and arguments",
+        "6. Manage environment variables",
+        "7. View current environment variables",
+        "8. Run MCP command",
+        "9. Exit",
+        "",
+        "=" * 60,
+        "",
+    ]
+)
+_ENV_MENU_TEXT = "\n".join(
+    [
+        "",
+        "=" * 60,
+        "ENVIRONMENT VARIABLES MANAGEMENT",
+        "=" * 60,
+        "",
+        "1. View current environment variables",
+        "2. Add/Update environment variable",
+        "3. Remove environment variable",
+        "4. Reset to defaults",
+        "5. Back to main menu",
+        "",
+    ]
+)
+
+# Read size when printing log files, and the default tail shown by view_logs
+# (override with MCP_LOG_TAIL_BYTES)
+LOG_CHUNK_SIZE = 64 * 1024
+LOG_TAIL_BYTES = 256 * 1024
+# Largest single os.sendfile call when copying a log to a file or pipe
+SENDFILE_CHUNK_SIZE = 1024 * 1024
+
+# Upper bound on waiting for a newly started server, and its poll interval
+START_TIMEOUT = 5.0
+START_POLL_INTERVAL = 0.05
+# How long a server process lookup is reused before the PID file and process
+# table are checked again
+PID_CACHE_TTL = 1.0
+# How long check_server_status reuses the model list from /api/tags
+TAGS_CACHE_TTL = 3.0
+# Printed by mcp_ollama_python.main.run once the stdio transport is up
+SERVER_READY_MARKER = b"Server started successfully"
+
+# Linux exposes each process's argv at /proc/<pid>/cmdline
+_HAVE_PROC_CMDLINE = os.path.exists("/proc/self/cmdline")
+
+# Per-server pipe files are named f"{_PIPE_PREFIX}{pid}{_PIPE_SUFFIX}"
+_PIPE_PREFIX = ".mcp_ollama_server_"
+_PIPE_SUFFIX = ".pipe"
 
 # Configure logging
 logging.basicConfig(
@@ -59,6 +159,18 @@ def _ensure_dirs() -> None:
         raise
 
 
+def _banner(title: str, rule: str = "=") -> None:
+    """
+    Print a section title between two 60-character rules in one write.
+
+    Args:
+        title: Section title
+        rule: Character the rules are drawn with
+    """
+    line = rule * 60
+    sys.stdout.write(f"\n{line}\n{title}\n{line}\n")
+
+
 def is_mcp_server_process(pid: int) -> bool:
     """
     Check if the given PID corresponds to an actual MCP server process.
@@ -69,41 +181,112 @@ def is_mcp_server_process(pid: int) -> bool:
     Returns:
         True if the PID is a valid MCP server process, False otherwise
     """
+    return _find_mcp_server_process(pid) is not None
+
+
+def _read_proc_cmdline(pid: int) -> Optional[bytes]:
+    """
+    Read a process's NUL-separated command line directly from /proc.
+
+    Args:
+        pid: Process ID to read
+
+    Returns:
+        The raw command line (empty if the process is gone or a zombie), or
+        None if /proc is not available on this platform
+    """
+    if not _HAVE_PROC_CMDLINE:
+        return None
+    try:
+        with open(f"/proc/{pid}/cmdline", "rb") as f:
+            return f.read()
+    except (FileNotFoundError, ProcessLookupError):
+        return b""
+    except OSError:
+        # e.g. hidepid=2: leave the decision to psutil
+        return None
+
+
+def _find_mcp_server_process(
+    pid: int,
+) -> Optional[Tuple["psutil.Process", List[str]]]:
+    """
+    Look up the given PID and return it if it is an MCP server process.
+
+    Args:
+        pid: Process ID to check
+
+    Returns:
+        The validated process handle and the command line it was classified
+        by, or None if it is not an MCP server
+    """
     if not isinstance(pid, int) or pid <= 0:
         logger.warning("Invalid PID: %s", pid)
-        return False
+        return None
+
+    # Level checked once: this runs for every PID lookup
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug("Checking if PID %d is MCP server process", pid)
+
+    # Where /proc exists the command line is classified from its raw bytes,
+    # so stale and reused PIDs are rejected before psutil is imported or a
+    # Process is built. The markers contain no NUL, so searching the
+    # NUL-separated buffer is the same as searching each argument
+    raw_cmdline = _read_proc_cmdline(pid)
+    if raw_cmdline is not None:
+        lowered = raw_cmdline.lower()
+        is_mcp = b"mcp_ollama_python" in lowered or b"mcp-ollama-python" in lowered
+        if not (is_mcp and (b"python" in lowered or b"poetry" in lowered)):
+            if debug:
+                logger.debug("PID %d is not an MCP server process", pid)
+            return None
+
+    import psutil
 
-    logger.debug("Checking if PID %d is MCP server process", pid)
     try:
         process = psutil.Process(pid)
+        if raw_cmdline is not None:
+            # Already classified above; only the handle was needed
+            if debug:
+                logger.debug("PID %d is MCP server: True", pid)
+            raw_args = raw_cmdline.rstrip(b"\0").split(b"\0")
+            return process, [os.fsdecode(arg) for arg in raw_args]
+
         if not process.is_running():
-            logger.debug("PID %d is not running", pid)
-            return False
+            if debug:
+                logger.debug("PID %d is not running", pid)
+            return None
 
         cmdline = process.cmdline()
         if not cmdline:
-            logger.debug("PID %d has no command line", pid)
-            return False
-
-        cmdline_str = " ".join(cmdline).lower()
-        is_python = "python" in cmdline_str or "python.exe" in cmdline_str
-        is_mcp = (
-            "mcp_ollama_python" in cmdline_str or "mcp-ollama-python" in cmdline_str
-        )
-        is_poetry_wrapper = "poetry" in cmdline_str and is_mcp
-
-        result = (is_python and is_mcp) or is_poetry_wrapper
-        logger.debug("PID %d is MCP server: %s", pid, result)
-        return result
+            if debug:
+                logger.debug("PID %d has no command line", pid)
+            return None
+
+        # Markers contain no spaces, so matching per argument is equivalent to
+        # matching the joined command line; the MCP marker is tested first as
+        # it rejects unrelated (e.g. reused) PIDs
+        args = [arg.lower() for arg in cmdline]
+        is_mcp = any("mcp_ollama_python" in a or "mcp-ollama-python" in a for a in args)
+        is_python = is_mcp and any("python" in a for a in args)
+        is_poetry_wrapper = is_mcp and any("poetry" in a for a in args)
+
+        result = is_python or is_poetry_wrapper
+        if debug:
+            logger.debug("PID %d is MCP server: %s", pid, result)
+        return (process, cmdline) if result else None
     except psutil.NoSuchProcess:
-        logger.debug("PID %d does not exist", pid)
-        return False
+        if debug:
+            logger.debug("PID %d does not exist", pid)
+        return None
     except psutil.AccessDenied:
         logger.warning("Access denied when checking PID %d", pid)
-        return False
+        return None
     except psutil.ZombieProcess:
-        logger.debug("PID %d is a zombie process", pid)
-        return False
+        if debug:
+            logger.debug("PID %d is a zombie process", pid)
+        return None
 
 
 def cleanup_stale_pipe_files(current_pid: Optional[int] = None) -> None:
@@ -111,39 +294,288 @@ def cleanup_stale_pipe_files(current_pid: Optional[int] = None) -> None:
     Remove all pipe files that don't correspond to the running MCP server.
 
     Args:
-        current_pid: PID of the currently running server (if any)
+        current_pid: PID of the currently running server (if any); the caller
+            must already have verified it with is_mcp_server_process()
     """
-    logger.debug("Cleaning up stale pipe files (current_pid=%s)", current_pid)
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug("Cleaning up stale pipe files (current_pid=%s)", current_pid)
     try:
-        for pipe_file in TMP_DIR.glob(".mcp_ollama_server_*.pipe"):
-            try:
-                filename = pipe_file.name
-                pid_str = filename.replace(".mcp_ollama_server_", "").replace(
-                    ".pipe", ""
-                )
-                file_pid = int(pid_str)
-
-                if file_pid != current_pid or not is_mcp_server_process(file_pid):
+        # One directory read; entries are matched by name without building
+        # Path objects or stat()ing them
+        with os.scandir(TMP_DIR) as entries:
+            for entry in entries:
+                filename = entry.name
+                if not (
+                    filename.startswith(_PIPE_PREFIX)
+                    and filename.endswith(_PIPE_SUFFIX)
+                ):
+                    continue
+                try:
+                    pid_str = filename[len(_PIPE_PREFIX) : -len(_PIPE_SUFFIX)]
+                    file_pid = int(pid_str)
+
+                    # Only the caller-verified server PID keeps its pipe file,
+                    # so the sweep never has to inspect processes itself
+                    if file_pid != current_pid:
+                        try:
+                            os.unlink(entry.path)
+                            logger.info("Cleaned up stale pipe file: %s", filename)
+                        except OSError as e:
+                            logger.warning("Could not remove %s: %s", filename, e)
+                except ValueError as e:
+                    if debug:
+                        logger.debug("Invalid PID in pipe filename %s: %s", filename, e)
                     try:
-                        pipe_file.unlink()
-                        logger.info("Cleaned up stale pipe file: %s", pipe_file.name)
+                        os.unlink(entry.path)
+                        logger.info("Cleaned up invalid pipe file: %s", filename)
                     except OSError as e:
-                        logger.warning("Could not remove %s: %s", pipe_file.name, e)
-            except ValueError as e:
-                logger.debug("Invalid PID in pipe filename %s: %s", pipe_file.name, e)
-                try:
-                    pipe_file.unlink()
-                    logger.info("Cleaned up invalid pipe file: %s", pipe_file.name)
-                except OSError as e:
-                    logger.warning(
-                        "Could not remove invalid pipe file %s: %s", pipe_file.name, e
-                    )
-            except OSError as e:
-                logger.warning("Error processing pipe file %s: %s", pipe_file.name, e)
+                        logger.warning(
+                            "Could not remove invalid pipe file %s: %s", filename, e
+                        )
+    except FileNotFoundError:
+        logger.debug("No tmp directory, nothing to clean up")
     except OSError as e:
         logger.error("Error during pipe cleanup: %s", e, exc_info=True)
 
 
+def _stat_or_none(path: Path) -> Optional[os.stat_result]:
+    """
+    Stat a file, treating a missing (or unreadable) file as absent.
+
+    Args:
+        path: File to stat
+
+    Returns:
+        The stat result, or None if the file cannot be stat()ed
+    """
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _rotate_log(path: Path, previous: Path) -> None:
+    """
+    Move a non-empty log aside so the next run starts a fresh file.
+
+    Args:
+        path: Current log file
+        previous: Where the previous run's log is kept (replaced if present)
+
+    Raises:
+        OSError: If the file cannot be moved
+    """
+    log_stat = _stat_or_none(path)
+    if log_stat is not None and log_stat.st_size > 0:
+        os.replace(path, previous)
+
+
+def _log_tail_bytes() -> int:
+    """
+    Return how many trailing bytes of each log view_logs shows.
+
+    Read from MCP_LOG_TAIL_BYTES (0 or less shows whole files), falling back
+    to LOG_TAIL_BYTES when unset or invalid.
+
+    Returns:
+        Tail size in bytes
+    """
+    raw = os.environ.get("MCP_LOG_TAIL_BYTES")
+    if not raw:
+        return LOG_TAIL_BYTES
+    try:
+        return int(raw)
+    except ValueError:
+        logger.warning("Ignoring invalid MCP_LOG_TAIL_BYTES=%r", raw)
+        return LOG_TAIL_BYTES
+
+
+def _print_log_file(
+    path: Path, header: str, empty_message: str, tail_bytes: int = 0
+) -> None:
+    """
+    Print a log file in fixed-size chunks so memory use does not grow with it.
+
+    Bytes are written straight to the stdout buffer when there is one, so
+    the log is not decoded and re-encoded on the way through.
+
+    Args:
+        path: Log file to print
+        header: Printed before the content when the file is not blank
+        empty_message: Printed instead when the file is empty or whitespace
+        tail_bytes: Show only the last this many bytes (from the next line
+            start) when positive and smaller than the file
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    out = getattr(sys.stdout, "buffer", None)
+    if out is None:
+        # Text-only stdout (e.g. a StringIO): decode incrementally so that
+        # characters split across chunks survive
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+        def write(data: bytes) -> None:
+            sys.stdout.write(decoder.decode(data))
+
+    else:
+        write = out.write
+
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        truncated = 0 < tail_bytes < size
+        if truncated:
+            start = size - tail_bytes
+            f.seek(start)
+            # Skip the partial first line, unless the tail is one long line
+            f.readline()
+            if f.tell() >= size:
+                f.seek(start)
+        shown = size - f.tell()
+
+        # Leading blank chunks are held back until content shows up, so a
+        # whitespace-only file still reports as empty
+        blank: List[bytes] = []
+        started = False
+        while chunk := f.read(LOG_CHUNK_SIZE):
+            if not chunk.strip():
+                blank.append(chunk)
+                continue
+            started = True
+            print(header)
+            if truncated:
+                print(f"... (truncated, showing last {shown} of {size} bytes)")
+            sys.stdout.flush()
+            for held in blank:
+                write(held)
+            write(chunk)
+            break
+
+        if started:
+            if out is None:
+                while chunk := f.read(LOG_CHUNK_SIZE):
+                    write(chunk)
+            elif not _sendfile_rest(f, out):
+                shutil.copyfileobj(f, out, LOG_CHUNK_SIZE)
+
+    if started:
+        write(b"\n")
+        sys.stdout.flush()
+    else:
+        print(empty_message)
+
+
+def _sendfile_rest(f: BinaryIO, out: BinaryIO) -> bool:
+    """
+    Copy the rest of a file to a stdout buffer with os.sendfile.
+
+    Only used when stdout is a regular file or a pipe, where the kernel can
+    move the pages without staging them in Python.
+
+    Args:
+        f: Source file, positioned where copying should start
+        out: Binary stdout buffer
+
+    Returns:
+        True if everything was sent, False if the caller should fall back to
+        a regular copy from the current position of f
+    """
+    if not hasattr(os, "sendfile"):
+        return False
+    try:
+        out_fd = out.fileno()
+        mode = os.fstat(out_fd).st_mode
+    except (OSError, ValueError):
+        return False
+    if not (stat.S_ISREG(mode) or stat.S_ISFIFO(mode)):
+        return False
+
+    out.flush()
+    in_fd = f.fileno()
+    offset = f.tell()
+    try:
+        while sent := os.sendfile(out_fd, in_fd, offset, SENDFILE_CHUNK_SIZE):
+            offset += sent
+    except OSError:
+        f.seek(offset)
+        return False
+    f.seek(offset)
+    return True
+
+
+# HTTP client shared by status checks so repeat menu visits reuse the
+# connection pool instead of setting up a transport per request
+_status_client: Optional["httpx.Client"] = None
+# Seconds an idle status connection is kept for reuse
+STATUS_KEEPALIVE = 120.0
+
+# Connect timeout for the pre-flight probe of a local Ollama server
+LOCAL_PROBE_TIMEOUT = 0.2
+
+
+def _get_status_client() -> "httpx.Client":
+    """
+    Return the shared HTTP client for status checks, creating it on first use.
+
+    Returns:
+        httpx.Client closed automatically at interpreter exit
+    """
+    global _status_client
+    if _status_client is None:
+        import httpx
+
+        # httpx drops idle connections after 5 s by default, shorter than a
+        # typical pause between menu actions; keep one around for longer
+        _status_client = httpx.Client(
+            timeout=2.0,
+            follow_redirects=False,
+            limits=httpx.Limits(
+                max_keepalive_connections=1, keepalive_expiry=STATUS_KEEPALIVE
+            ),
+        )
+        atexit.register(_status_client.close)
+    return _status_client
+
+
+def _probe_local_host(host: str) -> None:
+    """
+    Fail fast when a local Ollama host is not accepting connections.
+
+    Remote hosts are not probed, since a short connect timeout could
+    misreport a slow but healthy link.
+
+    Args:
+        host: Validated Ollama base URL
+
+    Raises:
+        httpx.ConnectError: If a local host refuses or does not answer
+    """
+    parts = urlsplit(host)
+    hostname = parts.hostname or ""
+    if not is_local_hostname(hostname):
+        return
+    port = parts.port or (443 if parts.scheme == "https" else 80)
+    try:
+        with socket.create_connection((hostname, port), LOCAL_PROBE_TIMEOUT):
+            pass
+    except OSError as e:
+        import httpx
+
+        raise httpx.ConnectError(str(e)) from e
+
+
+@dataclass
+class PidInfo:
+    """Result of reading the PID file and validating the process it names"""
+
+    process: Optional["psutil.Process"] = None
+    stored_pid: Optional[int] = None
+    error: Optional[str] = None
+    # Command line the process was validated by, reused for display
+    cmdline: Optional[List[str]] = None
+
+
 class MCPInteractive:
     """
     Interactive MCP Server Manager.
@@ -161,13 +593,61 @@ class MCPInteractive:
         """
         logger.debug("Initializing MCPInteractive")
         self.env_vars: Dict[str, str] = self.load_env_vars()
-        self.server: Optional[OllamaMCPServer] = None
-        self.ollama_client: Optional[OllamaClient] = None
+        # Last persisted state, so saves without changes skip the write
+        self._saved_env_vars: Dict[str, str] = dict(self.env_vars)
+        self.server: Optional["OllamaMCPServer"] = None
+        self.ollama_client: Optional["OllamaClient"] = None
+        # Discovered tools, shared by list_commands and run_mcp_command
+        self._tool_registry: Optional["ToolRegistry"] = None
+        # Event loop and client config reused by run_mcp_command
+        self._loop: Optional["asyncio.AbstractEventLoop"] = None
+        self._client_config: Tuple[Optional[str], Optional[str]] = (None, None)
+        # Write ends of the stdin pipes of servers started by this manager
+        self._stdin_pipes: Dict[int, int] = {}
+        # Last server started by this manager, waited on directly when stopped
+        self._server_proc: Optional["subprocess.Popen[bytes]"] = None
+        # Pipe files are swept on the first PID lookup and when the server
+        # state changes (start/stop/stale PID file), rather than on every
+        # status check
+        self._pipes_swept = False
+        # (fetch time, host, body) of the last successful /api/tags request
+        self._tags_cache: Optional[Tuple[float, str, Dict[str, Any]]] = None
+        # (lookup time, result) of the last get_pid_info() lookup
+        self._pid_cache: Optional[Tuple[float, PidInfo]] = None
+        # Menu choices, matching _MENU_TEXT ("9" exits and is handled in run)
+        self._actions: Dict[str, Callable[[], None]] = {
+            "1": self.check_server_status,
+            "2": self.start_server,
+            "3": self.stop_server,
+            "4": self.view_logs,
+            "5": self.list_commands,
+            "6": self.manage_env_vars,
+            "7": self.view_env_vars,
+            "8": self.run_mcp_command,
+        }
+        # Environment submenu choices, matching _ENV_MENU_TEXT ("5" goes back)
+        self._env_actions: Dict[str, Callable[[], None]] = {
+            "1": self.view_env_vars,
+            "2": self.add_env_var,
+            "3": self.remove_env_var,
+            "4": self.reset_env_vars,
+        }
         logger.info(
             "MCPInteractive initialized with %d environment variables",
             len(self.env_vars),
         )
 
+    def _sweep_pipe_files_once(self, current_pid: Optional[int] = None) -> None:
+        """
+        Run the stale pipe file sweep if it has not run yet.
+
+        Args:
+            current_pid: Verified PID of the running server (if any)
+        """
+        if not self._pipes_swept:
+            cleanup_stale_pipe_files(current_pid=current_pid)
+            self._pipes_swept = True
+
     def load_env_vars(self) -> Dict[str, str]:
         """
         Load saved environment variables from file.
@@ -178,7 +658,7 @@ class MCPInteractive:
         logger.debug("Loading environment variables from %s", ENV_VARS_FILE)
         if ENV_VARS_FILE.exists():
             try:
-                raw = json.loads(ENV_VARS_FILE.read_text())
+                raw = json_utils.loads(ENV_VARS_FILE.read_bytes())
                 env_vars = {}
                 for key, value in raw.items():
                     try:
@@ -203,16 +683,35 @@ class MCPInteractive:
         """
         Save environment variables to file.
 
+        The file is written to a temporary sibling created with mode 0600,
+        synced and atomically renamed into place; nothing is written when the variables
+        are unchanged since the last load or save.
+
         Raises:
             OSError: If file write fails
         """
+        if self.env_vars == self._saved_env_vars:
+            logger.debug("Environment variables unchanged, not saving")
+            return
+
         logger.debug(
             "Saving %d environment variables to %s", len(self.env_vars), ENV_VARS_FILE
         )
+        tmp_file = ENV_VARS_FILE.with_name(ENV_VARS_FILE.name + ".tmp")
         try:
-            ENV_VARS_FILE.write_text(json.dumps(self.env_vars, indent=2))
-            # Set restrictive permissions
-            os.chmod(ENV_VARS_FILE, 0o600)
+            fd = os.open(tmp_file, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o600)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(json_utils.dumps_indented(self.env_vars).encode())
+                    # Data must be on disk before the rename makes it the
+                    # live file, or a crash could leave it empty
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_file, ENV_VARS_FILE)
+            except OSError:
+                tmp_file.unlink(missing_ok=True)
+                raise
+            self._saved_env_vars = dict(self.env_vars)
             logger.info("Environment variables saved successfully")
         except OSError as e:
             logger.error("Failed to save environment variables: %s", e, exc_info=True)
@@ -224,10 +723,13 @@ class MCPInteractive:
 
         Sets all stored environment variables in os.environ.
         """
-        logger.debug("Applying %d environment variables", len(self.env_vars))
-        for key, value in self.env_vars.items():
-            os.environ[key] = value
-            logger.debug("Set %s=%s", key, value)
+        os.environ.update(self.env_vars)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Applied %d environment variables: %s",
+                len(self.env_vars),
+                list(self.env_vars),
+            )
         logger.info("Environment variables applied")
 
     def get_server_pid(self) -> Optional[int]:
@@ -237,30 +739,69 @@ class MCPInteractive:
         Returns:
             The PID of the running server, or None if not running
         """
+        process = self.get_server_process()
+        return process.pid if process is not None else None
+
+    def get_server_process(self) -> Optional["psutil.Process"]:
+        """
+        Get the running server's process.
+
+        Returns:
+            The validated server process, or None if not running
+        """
+        return self.get_pid_info().process
+
+    def get_pid_info(self) -> PidInfo:
+        """
+        Look up the server from the PID file, reusing a lookup made within
+        PID_CACHE_TTL seconds.
+
+        Returns:
+            What the lookup found, including the stored PID when the server
+            is not running
+        """
+        if self._pid_cache is not None:
+            checked_at, info = self._pid_cache
+            if time.monotonic() - checked_at < PID_CACHE_TTL:
+                return info
+        info = self._read_pid_info()
+        self._pid_cache = (time.monotonic(), info)
+        return info
+
+    def _read_pid_info(self) -> PidInfo:
+        """
+        Read the PID file and validate the process it names.
+
+        Returns:
+            What the lookup found
+        """
         logger.debug("Getting server PID from %s", PID_FILE)
         if PID_FILE.exists():
             try:
-                pid = int(PID_FILE.read_text().strip())
+                # int() accepts bytes and ignores surrounding whitespace
+                pid = int(PID_FILE.read_bytes())
                 logger.debug("Found PID %d in PID file", pid)
 
-                if is_mcp_server_process(pid):
-                    cleanup_stale_pipe_files(current_pid=pid)
+                match = _find_mcp_server_process(pid)
+                if match is not None:
+                    process, cmdline = match
+                    self._sweep_pipe_files_once(current_pid=pid)
                     logger.debug("Server is running with PID %d", pid)
-                    return pid
+                    return PidInfo(process=process, stored_pid=pid, cmdline=cmdline)
                 else:
                     logger.info("Found stale PID file, cleaning up")
                     PID_FILE.unlink()
                     cleanup_stale_pipe_files()
-                    return None
+                    return PidInfo(stored_pid=pid)
             except ValueError as e:
                 logger.warning("Invalid PID in file: %s", e)
-                return None
+                return PidInfo(error=str(e))
             except FileNotFoundError:
                 logger.debug("PID file disappeared during read")
-                return None
+                return PidInfo()
 
-        cleanup_stale_pipe_files()
-        return None
+        self._sweep_pipe_files_once()
+        return PidInfo()
 
     def check_server_status(self) -> None:
         """
@@ -268,38 +809,35 @@ class MCPInteractive:
 
         Displays server PID, process information, and Ollama connection status.
         """
+        import psutil
+
         logger.debug("Checking server status")
-        print("\n" + "=" * 60)
-        print("SERVER STATUS")
-        print("=" * 60)
+        _banner("SERVER STATUS")
 
-        pid = self.get_server_pid()
-        if pid:
-            print(f"✓ Server is RUNNING (PID: {pid})")
+        info = self.get_pid_info()
+        server = info.process
+        if server is not None:
+            print(f"✓ Server is RUNNING (PID: {server.pid})")
             print(f"  PID File: {PID_FILE}")
 
             try:
-                process = psutil.Process(pid)
-                print(f"  Process: {process.name()}")
-                print(f"  Command: {' '.join(process.cmdline()[:3])}...")
+                print(f"  Process: {server.name()}")
+                cmdline = info.cmdline or server.cmdline()
+                print(f"  Command: {' '.join(cmdline[:3])}...")
             except psutil.Error as e:
                 print(f"  Debug error: {e}")
         else:
             print("✗ Server is NOT RUNNING")
 
-            if PID_FILE.exists():
-                try:
-                    stored_pid = int(PID_FILE.read_text().strip())
-                    print(f"  Debug: PID file exists with PID {stored_pid}")
-                    try:
-                        process = psutil.Process(stored_pid)
-                        cmdline = " ".join(process.cmdline())
-                        print("  Debug: Process exists but validation failed")
-                        print(f"  Debug: Command line: {cmdline}")
-                    except psutil.NoSuchProcess:
-                        print(f"  Debug: Process {stored_pid} does not exist")
-                except (ValueError, OSError) as e:
-                    print(f"  Debug: Error reading PID file: {e}")
+            # Reported from the lookup above rather than by reading the PID
+            # file again (a stale one has already been removed by then)
+            if info.error is not None:
+                print(f"  Debug: Error reading PID file: {info.error}")
+            elif info.stored_pid is not None:
+                print(
+                    f"  Debug: Removed stale PID file (PID {info.stored_pid} "
+                    "is not an MCP server process)"
+                )
 
         # Check Ollama connection
         print("\nOllama Connection:")
@@ -310,20 +848,24 @@ class MCPInteractive:
             import httpx
 
             safe_host = validate_ollama_host(ollama_host)
-            response = httpx.get(
-                f"{safe_host}/api/tags", timeout=2.0, follow_redirects=False
-            )
-            if response.status_code == 200:
+            # Reuse a recent answer when the user checks again right away
+            data = self._get_cached_tags(safe_host)
+            if data is None:
+                _probe_local_host(safe_host)
+                response = _get_status_client().get(f"{safe_host}/api/tags")
+                if response.status_code == 200:
+                    data = json_utils.loads(response.content)
+                    self._tags_cache = (time.monotonic(), safe_host, data)
+                else:
+                    print(f"  Status: ✗ Error (HTTP {response.status_code})")
+            if data is not None:
                 print("  Status: ✓ Connected")
-                data = response.json()
                 models = data.get("models", [])
                 print(f"  Available Models: {len(models)}")
                 if models:
-                    print("  Models:", ", ".join([m["name"] for m in models[:5]]))
+                    print("  Models:", ", ".join(m["name"] for m in models[:5]))
                     if len(models) > 5:
                         print(f"           ... and {len(models) - 5} more")
-            else:
-                print(f"  Status: ✗ Error (HTTP {response.status_code})")
         except httpx.RequestError as e:
             print(f"  Status: ✗ Cannot connect ({str(e)[:50]})")
         except ValueError as e:
@@ -332,6 +874,24 @@ class MCPInteractive:
         print("=" * 60)
         input("\nPress Enter to continue...")
 
+    def _get_cached_tags(self, host: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the /api/tags response for host if fetched within
+        TAGS_CACHE_TTL seconds.
+
+        Args:
+            host: Validated Ollama host URL
+
+        Returns:
+            The cached response body, or None if there is no fresh entry
+        """
+        if self._tags_cache is None:
+            return None
+        fetched_at, cached_host, data = self._tags_cache
+        if cached_host != host or time.monotonic() - fetched_at >= TAGS_CACHE_TTL:
+            return None
+        return data
+
     def start_server(self) -> None:
         """
         Start the MCP server.
@@ -340,9 +900,7 @@ class MCPInteractive:
         the server process with proper logging and error handling.
         """
         logger.info("Starting MCP server")
-        print("\n" + "=" * 60)
-        print("START SERVER")
-        print("=" * 60)
+        _banner("START SERVER")
 
         existing_pid = self.get_server_pid()
         if existing_pid:
@@ -363,6 +921,9 @@ class MCPInteractive:
             env = os.environ.copy()
             env.update(self.env_vars)
 
+            # Unbuffered output, so the readiness line reaches the log at once
+            env["PYTHONUNBUFFERED"] = "1"
+
             # Remove PYTHONHOME which can interfere
             env.pop("PYTHONHOME", None)
 
@@ -371,11 +932,16 @@ class MCPInteractive:
                 print(f"  Clearing PYTHONPATH: {env['PYTHONPATH']}")
                 env.pop("PYTHONPATH", None)
 
-            # Open log files
+            # Keep the previous run's output, then open fresh log files
+            _rotate_log(LOG_FILE, PREVIOUS_LOG_FILE)
+            _rotate_log(ERROR_LOG_FILE, PREVIOUS_ERROR_LOG_FILE)
             log_file = open(LOG_FILE, "w", encoding="utf-8")
             error_log_file = open(ERROR_LOG_FILE, "w", encoding="utf-8")
 
-            # Create a pipe for stdin to keep the server running
+            # Create a pipe for stdin to keep the server running. Both ends
+            # are non-inheritable (PEP 446); Popen dup()s the read end onto
+            # the child's fd 0 and close_fds keeps every other descriptor,
+            # including our write end, out of the child
             stdin_read, stdin_write = os.pipe()
 
             try:
@@ -399,7 +965,7 @@ class MCPInteractive:
                     stderr=error_log_file,
                     env=env,
                     start_new_session=True,
-                    close_fds=False,
+                    close_fds=True,
                     creationflags=creationflags,
                 )
             except Exception:
@@ -415,12 +981,25 @@ class MCPInteractive:
             # Log files are inherited by the child; close parent copies
             log_file.close()
             error_log_file.close()
-            # Store write end so we can close it when stopping
-            pipe_file = TMP_DIR / f".mcp_ollama_server_{process.pid}.pipe"
-            pipe_file.write_text(str(stdin_write))
+            # Keep the write end so stop_server can close it (EOF on the
+            # server's stdin); the pipe file only marks the server as ours,
+            # since a descriptor number means nothing to other processes
+            self._stdin_pipes[process.pid] = stdin_write
+            self._server_proc = process
+            pipe_file = TMP_DIR / f"{_PIPE_PREFIX}{process.pid}{_PIPE_SUFFIX}"
+            pipe_file.touch()
+            self._pipes_swept = False
 
             PID_FILE.write_text(str(process.pid))
-            time.sleep(1)
+            self._pid_cache = None
+
+            # Done as soon as the server reports it is serving (ready) or
+            # exits (failed), instead of sleeping a fixed interval
+            deadline = time.monotonic() + START_TIMEOUT
+            while process.poll() is None and time.monotonic() < deadline:
+                if SERVER_READY_MARKER in LOG_FILE.read_bytes():
+                    break
+                time.sleep(START_POLL_INTERVAL)
 
             if process.poll() is None:
                 print(f"\n✓ Server started successfully (PID: {process.pid})")
@@ -444,25 +1023,31 @@ class MCPInteractive:
         Sends SIGTERM to the server process, waits for graceful shutdown,
         and forces termination if necessary.
         """
+        import psutil
+
         logger.info("Stopping MCP server")
-        print("\n" + "=" * 60)
-        print("STOP SERVER")
-        print("=" * 60)
+        _banner("STOP SERVER")
 
-        pid = self.get_server_pid()
+        process = self.get_server_process()
 
-        if not pid:
+        if process is None:
             print("✗ No server is currently running")
             input("\nPress Enter to continue...")
             return
 
+        pid = process.pid
+        # Whatever happens below, the next lookup must look again
+        self._pid_cache = None
         print(f"\nStopping server (PID: {pid})...")
 
         try:
-            # Remove the pipe file to signal EOF to the child process.
-            # Note: the numeric FD stored in the file is only valid in the
-            # process that created it, so we just delete the file here.
-            pipe_file = TMP_DIR / f".mcp_ollama_server_{pid}.pipe"
+            # If this manager started the server, closing its stdin pipe
+            # signals EOF so it can shut down before SIGTERM arrives
+            stdin_write = self._stdin_pipes.pop(pid, None)
+            if stdin_write is not None:
+                os.close(stdin_write)
+
+            pipe_file = TMP_DIR / f"{_PIPE_PREFIX}{pid}{_PIPE_SUFFIX}"
             if pipe_file.exists():
                 try:
                     pipe_file.unlink()
@@ -472,32 +1057,23 @@ class MCPInteractive:
 
             os.kill(pid, signal.SIGTERM)
 
-            for _ in range(50):
-                try:
-                    os.kill(pid, 0)
-                    time.sleep(0.1)
-                except OSError:
-                    break
-
-            try:
-                os.kill(pid, 0)
+            # Block until exit instead of probing with signal 0 on a fixed tick
+            if not self._wait_for_exit(process, 5):
                 print("  Server didn't stop gracefully, forcing shutdown...")
                 try:
-                    process = psutil.Process(pid)
                     if sys.platform == "win32":
                         process.terminate()
                     else:
                         process.kill()
-                    process.wait(timeout=2)
-                except (psutil.NoSuchProcess, psutil.TimeoutExpired):
+                    self._wait_for_exit(process, 2)
+                except psutil.NoSuchProcess:
                     pass
-            except OSError:
-                pass
 
             if PID_FILE.exists():
                 PID_FILE.unlink()
 
             print("  Cleaning up temporary files...")
+            self._pipes_swept = False
             cleanup_stale_pipe_files()
 
             print("\n✓ Server stopped successfully")
@@ -505,10 +1081,50 @@ class MCPInteractive:
             print(f"\n✗ Failed to stop server: {e}")
             if PID_FILE.exists():
                 PID_FILE.unlink()
+            self._pipes_swept = False
             cleanup_stale_pipe_files()
 
         input("\nPress Enter to continue...")
 
+    def _wait_for_exit(self, process: "psutil.Process", timeout: float) -> bool:
+        """
+        Wait for the server process to exit.
+
+        A server started by this manager is waited on through its Popen
+        handle, which reaps it and records its exit status. Any other server
+        goes through psutil, which waits on a pidfd (Linux) or kqueue
+        (macOS/BSD) where available instead of polling.
+
+        Args:
+            process: Server process
+            timeout: Seconds to wait
+
+        Returns:
+            True if the process has exited, False on timeout
+        """
+        import psutil
+
+        child = self._server_proc
+        if child is not None and child.pid == process.pid:
+            # Sleep until the kernel reports the exit, then reap; Popen.wait
+            # alone would poll with a growing sleep
+            if wait_for_exit(child.pid, timeout) is False:
+                return False
+            try:
+                child.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                return False
+            self._server_proc = None
+            return True
+
+        try:
+            process.wait(timeout=timeout)
+        except psutil.TimeoutExpired:
+            return False
+        except psutil.NoSuchProcess:
+            pass
+        return True
+
     def list_commands(self) -> None:
         """
         List available MCP commands.
@@ -517,41 +1133,34 @@ class MCPInteractive:
         and argument specifications.
         """
         logger.debug("Listing available commands")
-        print("\n" + "=" * 60)
-        print("AVAILABLE MCP COMMANDS")
-        print("=" * 60)
+        _banner("AVAILABLE MCP COMMANDS")
 
         print("\nInitializing server to discover tools...")
 
         try:
-            from mcp_ollama_python.autoloader import discover_tools_with_handlers
-
-            async def get_tools():
-                registry = await discover_tools_with_handlers()
-                return registry.tools
-
-            tools = asyncio.run(get_tools())
-
-            print(f"\nFound {len(tools)} tools:\n")
+            tools = self._get_tool_registry().tools
 
+            # Rendered into one buffer and written once
+            lines = [f"\nFound {len(tools)} tools:\n"]
             for i, tool in enumerate(tools, 1):
-                print(f"{i}. {tool.name}")
-                print(f"   Description: {tool.description}")
+                lines.append(f"{i}. {tool.name}")
+                lines.append(f"   Description: {tool.description}")
 
                 if tool.input_schema and "properties" in tool.input_schema:
                     props = tool.input_schema["properties"]
-                    required = tool.input_schema.get("required", [])
-
-                    print("   Arguments:")
-                    for prop_name, prop_info in props.items():
-                        req_marker = "*" if prop_name in required else " "
-                        prop_type = prop_info.get("type", "any")
-                        prop_desc = prop_info.get("description", "No description")
-                        print(
-                            f"     {req_marker} {prop_name} ({prop_type}): {prop_desc}"
-                        )
+                    required = frozenset(tool.input_schema.get("required", ()))
+
+                    lines.append("   Arguments:")
+                    lines.extend(
+                        f"     {'*' if prop_name in required else ' '} {prop_name} "
+                        f"({prop_info.get('type', 'any')}): "
+                        f"{prop_info.get('description', 'No description')}"
+                        for prop_name, prop_info in props.items()
+                    )
 
-                print()
+                lines.append("")
+            lines.append("")
+            sys.stdout.write("\n".join(lines))
 
         except (ImportError, RuntimeError) as e:
             print(f"\n✗ Error discovering tools: {e}")
@@ -570,26 +1179,13 @@ class MCPInteractive:
         """
         logger.debug("Managing environment variables")
         while True:
-            print("\n" + "=" * 60)
-            print("ENVIRONMENT VARIABLES MANAGEMENT")
-            print("=" * 60)
-
-            print("\n1. View current environment variables")
-            print("2. Add/Update environment variable")
-            print("3. Remove environment variable")
-            print("4. Reset to defaults")
-            print("5. Back to main menu")
+            sys.stdout.write(_ENV_MENU_TEXT)
 
             choice = input("\nSelect option (1-5): ").strip()
 
-            if choice == "1":
-                self.view_env_vars()
-            elif choice == "2":
-                self.add_env_var()
-            elif choice == "3":
-                self.remove_env_var()
-            elif choice == "4":
-                self.reset_env_vars()
+            action = self._env_actions.get(choice)
+            if action is not None:
+                action()
             elif choice == "5":
                 break
             else:
@@ -602,9 +1198,7 @@ class MCPInteractive:
         Displays both custom and system Ollama-related environment variables.
         """
         logger.debug("Viewing environment variables")
-        print("\n" + "-" * 60)
-        print("CURRENT ENVIRONMENT VARIABLES")
-        print("-" * 60)
+        _banner("CURRENT ENVIRONMENT VARIABLES", "-")
 
         if not self.env_vars:
             print("\nNo custom environment variables set.")
@@ -623,11 +1217,11 @@ class MCPInteractive:
             for key, value in self.env_vars.items():
                 print(f"  {key} = {value}")
 
-        print("\n" + "-" * 60)
-        print("SYSTEM ENVIRONMENT VARIABLES (Ollama-related)")
-        print("-" * 60)
+        _banner("SYSTEM ENVIRONMENT VARIABLES (Ollama-related)", "-")
 
-        ollama_vars = {k: v for k, v in os.environ.items() if "OLLAMA" in k.upper()}
+        # Filter on keys first: os.environ decodes a value on every access,
+        # so only the matching ones are fetched
+        ollama_vars = {k: os.environ[k] for k in os.environ if "OLLAMA" in k.upper()}
         if ollama_vars:
             for key, value in ollama_vars.items():
                 print(f"  {key} = {value}")
@@ -643,9 +1237,7 @@ class MCPInteractive:
         Prompts user for variable name and value, then saves to configuration.
         """
         logger.debug("Adding/updating environment variable")
-        print("\n" + "-" * 60)
-        print("ADD/UPDATE ENVIRONMENT VARIABLE")
-        print("-" * 60)
+        _banner("ADD/UPDATE ENVIRONMENT VARIABLE", "-")
 
         print("\nCommon variables:")
         print("  OLLAMA_HOST")
@@ -698,9 +1290,7 @@ class MCPInteractive:
         Prompts user to select a variable to remove from configuration.
         """
         logger.debug("Removing environment variable")
-        print("\n" + "-" * 60)
-        print("REMOVE ENVIRONMENT VARIABLE")
-        print("-" * 60)
+        _banner("REMOVE ENVIRONMENT VARIABLE", "-")
 
         if not self.env_vars:
             print("\nNo custom environment variables to remove.")
@@ -718,16 +1308,17 @@ class MCPInteractive:
         if choice.lower() == "cancel":
             return
 
-        try:
+        # Only a numeric selection needs the ordered key list
+        if choice.isdecimal():
             idx = int(choice) - 1
-            keys = list(self.env_vars.keys())
+            keys = list(self.env_vars)
             if 0 <= idx < len(keys):
                 key = keys[idx]
             else:
                 print("Invalid number.")
                 input("\nPress Enter to continue...")
                 return
-        except ValueError:
+        else:
             key = choice
 
         if key in self.env_vars:
@@ -746,9 +1337,7 @@ class MCPInteractive:
         Clears all custom environment variables after user confirmation.
         """
         logger.debug("Resetting environment variables")
-        print("\n" + "-" * 60)
-        print("RESET ENVIRONMENT VARIABLES")
-        print("-" * 60)
+        _banner("RESET ENVIRONMENT VARIABLES", "-")
 
         confirm = (
             input("\nAre you sure you want to reset all custom variables? (yes/no): ")
@@ -765,6 +1354,84 @@ class MCPInteractive:
 
         input("\nPress Enter to continue...")
 
+    def _run_async(self, coro: Coroutine[Any, Any, T]) -> T:
+        """
+        Run a coroutine on the manager's event loop, creating it on first use.
+
+        Args:
+            coro: Coroutine to run to completion
+
+        Returns:
+            The coroutine's result
+        """
+        if self._loop is None:
+            import asyncio
+
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
+
+    def _get_tool_registry(self) -> "ToolRegistry":
+        """
+        Return the tool registry, discovering tools only on first use.
+
+        Tools are static for the life of the process, so one registry is
+        shared by list_commands and the in-process MCP server.
+
+        Returns:
+            ToolRegistry with all discovered tools and handlers
+        """
+        if self._tool_registry is None:
+            if self.server is not None and self.server.tool_registry is not None:
+                self._tool_registry = self.server.tool_registry
+            else:
+                from mcp_ollama_python.autoloader import discover_tools_with_handlers
+
+                self._tool_registry = self._run_async(discover_tools_with_handlers())
+        return self._tool_registry
+
+    def _get_mcp_server(self) -> "OllamaMCPServer":
+        """
+        Return the in-process MCP server, reusing it across commands.
+
+        The Ollama client reads OLLAMA_HOST and OLLAMA_API_KEY when it is
+        created, so the client and server are rebuilt if either has changed.
+
+        Returns:
+            OllamaMCPServer backed by the shared OllamaClient
+
+        Raises:
+            ValueError: If OLLAMA_HOST is not a permitted host
+        """
+        from mcp_ollama_python.ollama_client import OllamaClient
+        from mcp_ollama_python.server import OllamaMCPServer
+
+        config = (os.environ.get("OLLAMA_HOST"), os.environ.get("OLLAMA_API_KEY"))
+        if self.server is None or config != self._client_config:
+            self._close_ollama_client()
+            self.ollama_client = OllamaClient()
+            self.server = OllamaMCPServer(self.ollama_client)
+            self.server.tool_registry = self._tool_registry
+            self._client_config = config
+        return self.server
+
+    def _close_ollama_client(self) -> None:
+        """Close the shared Ollama client's HTTP connections, if any."""
+        if self.ollama_client is not None:
+            self._run_async(self.ollama_client.client.aclose())
+            self.ollama_client = None
+            self.server = None
+
+    def close(self) -> None:
+        """
+        Release the shared Ollama client and event loop.
+
+        Called from main() on exit; safe to call more than once.
+        """
+        self._close_ollama_client()
+        if self._loop is not None:
+            self._loop.close()
+            self._loop = None
+
     def run_mcp_command(self) -> None:
         """
         Run an MCP command interactively.
@@ -773,19 +1440,17 @@ class MCPInteractive:
         arguments, and executes the selected command.
         """
         logger.debug("Running MCP command interactively")
-        print("\n" + "=" * 60)
-        print("RUN MCP COMMAND")
-        print("=" * 60)
+        _banner("RUN MCP COMMAND")
 
         print("\nInitializing MCP server...")
 
+        import asyncio
+
         try:
             self.apply_env_vars()
+            server = self._get_mcp_server()
 
             async def execute_command():
-                ollama_client = OllamaClient()
-                server = OllamaMCPServer(ollama_client)
-
                 tools_result = await server.handle_list_tools()
                 tools = tools_result["tools"]
 
@@ -793,12 +1458,12 @@ class MCPInteractive:
                     print("\n✗ No tools available.")
                     return
 
-                print(f"\nAvailable commands ({len(tools)}):\n")
+                lines = [f"\nAvailable commands ({len(tools)}):\n"]
                 for i, tool in enumerate(tools, 1):
-                    print(f"{i}. {tool['name']}")
-                    print(f"   {tool['description']}")
-
-                print()
+                    lines.append(f"{i}. {tool['name']}")
+                    lines.append(f"   {tool['description']}")
+                lines.append("\n")
+                sys.stdout.write("\n".join(lines))
                 choice = input(
                     "Select command number (or 'cancel' to go back): "
                 ).strip()
@@ -818,15 +1483,13 @@ class MCPInteractive:
                 selected_tool = tools[idx]
                 tool_name = selected_tool["name"]
 
-                print("\n" + "-" * 60)
-                print(f"COMMAND: {tool_name}")
-                print("-" * 60)
+                _banner(f"COMMAND: {tool_name}", "-")
                 print(f"Description: {selected_tool['description']}")
 
                 args = {}
                 schema = selected_tool.get("inputSchema", {})
                 properties = schema.get("properties", {})
-                required = schema.get("required", [])
+                required = frozenset(schema.get("required", ()))
 
                 if properties:
                     print("\nArguments:")
@@ -888,15 +1551,11 @@ class MCPInteractive:
                 )
                 args["format"] = "markdown" if format_choice == "2" else "json"
 
-                print("\n" + "=" * 60)
-                print("EXECUTING COMMAND...")
-                print("=" * 60)
+                _banner("EXECUTING COMMAND...")
 
                 result = await server.handle_call_tool(tool_name, args)
 
-                print("\n" + "-" * 60)
-                print("RESULT:")
-                print("-" * 60)
+                _banner("RESULT:", "-")
 
                 if "content" in result:
                     for item in result["content"]:
@@ -908,9 +1567,7 @@ class MCPInteractive:
                 else:
                     print("\n✓ Command executed successfully.")
 
-                await ollama_client.client.aclose()
-
-            asyncio.run(execute_command())
+            self._run_async(execute_command())
 
         except (RuntimeError, asyncio.CancelledError) as e:
             print(f"\n✗ Error executing command: {e}")
@@ -924,56 +1581,81 @@ class MCPInteractive:
         """
         View server logs.
 
-        Displays contents of both standard log and error log files.
+        Displays the tail of both standard log and error log files, and the
+        whole files on request when either was truncated.
         """
         logger.debug("Viewing server logs")
-        print("\n" + "=" * 60)
-        print("SERVER LOGS")
-        print("=" * 60)
+        if self._print_logs(_log_tail_bytes()):
+            answer = input("\nShow the full logs? (y/N): ").strip().lower()
+            if answer != "y":
+                return
+            self._print_logs(0)
+
+        input("\nPress Enter to continue...")
 
-        if LOG_FILE.exists():
+    def _print_logs(self, tail_bytes: int) -> bool:
+        """
+        Print both log files and their sizes.
+
+        Args:
+            tail_bytes: Per-file tail size passed to _print_log_file (0 for
+                whole files)
+
+        Returns:
+            True if either file was larger than tail_bytes and got truncated
+        """
+        _banner("SERVER LOGS")
+
+        # One stat per file answers both "does it exist" and its size
+        log_stat = _stat_or_none(LOG_FILE)
+        error_log_stat = _stat_or_none(ERROR_LOG_FILE)
+
+        if log_stat is not None:
             print("\nLog file:")
             print(LOG_FILE)
             try:
-                with open(LOG_FILE, "r", encoding="utf-8", errors="replace") as f:
-                    content = f.read()
-                    if content.strip():
-                        print("\nLog content:")
-                        print(content)
-                    else:
-                        print("\nLog file is empty.")
+                _print_log_file(
+                    LOG_FILE, "\nLog content:", "\nLog file is empty.", tail_bytes
+                )
             except OSError as e:
                 print(f"\nError reading log file: {e}")
         else:
             print("\nNo log file found.")
 
-        if ERROR_LOG_FILE.exists():
+        if error_log_stat is not None:
             print("\n" + "-" * 60)
             print("Error log file:")
             print(ERROR_LOG_FILE)
             try:
-                with open(ERROR_LOG_FILE, "r", encoding="utf-8", errors="replace") as f:
-                    content = f.read()
-                    if content.strip():
-                        print("\nError log content:")
-                        print(content)
-                    else:
-                        print("\nError log file is empty (no errors).")
+                _print_log_file(
+                    ERROR_LOG_FILE,
+                    "\nError log content:",
+                    "\nError log file is empty (no errors).",
+                    tail_bytes,
+                )
             except OSError as e:
                 print(f"\nError reading error log file: {e}")
         else:
             print("\nNo error log file found.")
 
-        print("\n" + "-" * 60)
-        print("File Information:")
-        if LOG_FILE.exists():
-            size = LOG_FILE.stat().st_size
-            print(f"  Log file size: {size} bytes")
-        if ERROR_LOG_FILE.exists():
-            size = ERROR_LOG_FILE.stat().st_size
-            print(f"  Error log file size: {size} bytes")
-
-        input("\nPress Enter to continue...")
+        info = ["\n" + "-" * 60, "File Information:"]
+        if log_stat is not None:
+            info.append(f"  Log file size: {log_stat.st_size} bytes")
+        if error_log_stat is not None:
+            info.append(f"  Error log file size: {error_log_stat.st_size} bytes")
+        for label, previous in (
+            ("Previous log", PREVIOUS_LOG_FILE),
+            ("Previous error log", PREVIOUS_ERROR_LOG_FILE),
+        ):
+            previous_stat = _stat_or_none(previous)
+            if previous_stat is not None:
+                info.append(f"  {label}: {previous} ({previous_stat.st_size} bytes)")
+        print("\n".join(info))
+
+        return tail_bytes > 0 and any(
+            st is not None and st.st_size > tail_bytes
+            for st in (log_stat, error_log_stat)
+        )
 
     def show_menu(self) -> None:
         """
@@ -981,19 +1663,7 @@ class MCPInteractive:
 
         Shows all available menu options for the interactive manager.
         """
-        print("\n" + "=" * 60)
-        print("OLLAMA MCP SERVER - INTERACTIVE MANAGER")
-        print("=" * 60)
-        print("1. Check MCP server status")
-        print("2. Start server")
-        print("3. Stop server")
-        print("4. View server logs")
-        print("5. List server commands and arguments")
-        print("6. Manage environment variables")
-        print("7. View current environment variables")
-        print("8. Run MCP command")
-        print("9. Exit")
-        print("\n" + "=" * 60)
+        sys.stdout.write(_MENU_TEXT)
 
     def run(self) -> None:
         """
@@ -1006,22 +1676,9 @@ class MCPInteractive:
             self.show_menu()
             choice = input("\nSelect option (1-9): ").strip()
 
-            if choice == "1":
-                self.check_server_status()
-            elif choice == "2":
-                self.start_server()
-            elif choice == "3":
-                self.stop_server()
-            elif choice == "4":
-                self.view_logs()
-            elif choice == "5":
-                self.list_commands()
-            elif choice == "6":
-                self.manage_env_vars()
-            elif choice == "7":
-                self.view_env_vars()
-            elif choice == "8":
-                self.run_mcp_command()
+            action = self._actions.get(choice)
+            if action is not None:
+                action()
             elif choice == "9":
                 print("\nExiting... Goodbye!")
                 break
@@ -1042,6 +1699,7 @@ def main() -> None:
     """
     logger.info("Starting MCP Interactive Manager")
     _ensure_dirs()
+    manager: Optional[MCPInteractive] = None
     try:
         manager = MCPInteractive()
         manager.run()
@@ -1054,6 +1712,11 @@ def main() -> None:
 
         traceback.print_exc()
         sys.exit(1)
+    finally:
+        # Release the shared client and event loop while the interpreter is
+        # still fully up
+        if manager is not None:
+            manager.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,64 @@
+"""
+Process helpers shared by the server control and interactive manager scripts
+"""
+
+import os
+import select
+import sys
+from typing import Optional
+
+
+def wait_for_exit(pid: int, timeout: float) -> Optional[bool]:
+    """
+    Wait for a process to exit without polling.
+
+    Uses a pidfd on Linux 5.3+ and kqueue NOTE_EXIT on macOS/FreeBSD. A
+    process that has already exited (and been reaped) counts as exited; an
+    unreaped child stays visible until its parent waits on it.
+
+    Args:
+        pid: Process to wait for
+        timeout: Seconds to wait
+
+    Returns:
+        True if the process exited, False on timeout, or None if neither
+        mechanism is available and the caller has to poll
+    """
+    if sys.platform == "linux":
+        pidfd_open = getattr(os, "pidfd_open", None)
+        if pidfd_open is None:
+            return None
+        try:
+            pidfd = pidfd_open(pid)
+        except ProcessLookupError:
+            return True
+        except OSError:
+            return None
+        try:
+            poller = select.poll()
+            poller.register(pidfd, select.POLLIN)
+            return bool(poller.poll(timeout * 1000))
+        finally:
+            os.close(pidfd)
+
+    if sys.platform == "darwin" or sys.platform.startswith("freebsd"):
+        try:
+            kq = select.kqueue()
+        except OSError:
+            return None
+        try:
+            event = select.kevent(
+                pid,
+                filter=select.KQ_FILTER_PROC,
+                flags=select.KQ_EV_ADD | select.KQ_EV_ONESHOT,
+                fflags=select.KQ_NOTE_EXIT,
+            )
+            return bool(kq.control([event], 1, timeout))
+        except ProcessLookupError:
+            return True
+        except OSError:
+            return None
+        finally:
+            kq.close()
+
+    return None
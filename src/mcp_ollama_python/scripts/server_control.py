@@ -13,14 +13,41 @@ import signal
 import subprocess
 import sys
 import time
-from typing import Optional
+from typing import Callable, Dict, Optional
 
-import psutil
+from mcp_ollama_python.scripts.process_utils import wait_for_exit
+
+# psutil is imported where it is used, so that 'help', and 'status' on
+# Linux, do not pay for it
 
 # Data directory in user home
 DATA_DIR = Path.home() / ".mcp-ollama-python"
 TMP_DIR = DATA_DIR / "tmp"
 PID_FILE = TMP_DIR / ".mcp_ollama_server.pid"
+# Plain-string forms for the os-level calls, built once
+_TMP_DIR_STR = str(TMP_DIR)
+_PID_FILE_STR = str(PID_FILE)
+LOGS_DIR = DATA_DIR / "logs"
+# Output of servers started by this script (appended to, never piped)
+SERVER_LOG_FILE = LOGS_DIR / "mcp_ollama_server_control.log"
+
+# Linux exposes each process's argv at /proc/<pid>/cmdline
+_HAVE_PROC_CMDLINE = os.path.exists("/proc/self/cmdline")
+
+# Per-server pipe files are named f"{_PIPE_PREFIX}{pid}{_PIPE_SUFFIX}"
+_PIPE_PREFIX = ".mcp_ollama_server_"
+_PIPE_SUFFIX = ".pipe"
+
+# Whether cleanup_stale_pipe_files() has run in this process, and for which
+# current_pid
+_pipes_swept = False
+_swept_pid: Optional[int] = None
+
+# Last server started by this process, reaped directly when stopped
+_server_proc: Optional["subprocess.Popen[bytes]"] = None
+
+# How long a new server must stay up to count as started
+START_GRACE_PERIOD = 1.0
 
 # Configure logging
 logging.basicConfig(
@@ -47,6 +74,29 @@ def _ensure_dirs() -> None:
         raise
 
 
+def _read_proc_cmdline(pid: int) -> Optional[bytes]:
+    """
+    Read a process's NUL-separated command line directly from /proc.
+
+    Args:
+        pid: Process ID to read
+
+    Returns:
+        The raw command line (empty if the process is gone or a zombie), or
+        None if /proc is not available on this platform
+    """
+    if not _HAVE_PROC_CMDLINE:
+        return None
+    try:
+        with open(f"/proc/{pid}/cmdline", "rb") as f:
+            return f.read()
+    except (FileNotFoundError, ProcessLookupError):
+        return b""
+    except OSError:
+        # e.g. hidepid=2: leave the decision to psutil
+        return None
+
+
 def is_mcp_server_process(pid: int) -> bool:
     """
     Check if the given PID corresponds to an actual MCP server process.
@@ -62,6 +112,29 @@ def is_mcp_server_process(pid: int) -> bool:
         return False
 
     logger.debug("Checking if PID %d is MCP server process", pid)
+
+    # Where /proc exists the raw NUL-separated command line is enough; the
+    # markers contain no NUL or space, so this matches the joined check below
+    raw_cmdline = _read_proc_cmdline(pid)
+    if raw_cmdline is not None:
+        lowered = raw_cmdline.lower()
+        is_mcp = b"python" in lowered and b"mcp_ollama_python" in lowered
+        logger.debug("PID %d is MCP server: %s", pid, is_mcp)
+        return is_mcp
+
+    # Most stale PIDs are simply gone: one signal-0 probe settles that before
+    # psutil is imported. Not on Windows, where os.kill terminates the target
+    if sys.platform != "win32":
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            logger.debug("PID %d does not exist", pid)
+            return False
+        except PermissionError:
+            pass  # exists, owned by another user
+
+    import psutil
+
     try:
         process = psutil.Process(pid)
         if not process.is_running():
@@ -73,8 +146,16 @@ def is_mcp_server_process(pid: int) -> bool:
             logger.debug("PID %d has no command line", pid)
             return False
 
-        cmdline_str = " ".join(cmdline).lower()
-        is_mcp = "python" in cmdline_str and "mcp_ollama_python" in cmdline_str
+        # Markers contain no spaces, so testing each argument is equivalent to
+        # testing the joined command line, without building it
+        has_python = has_mcp = False
+        for arg in cmdline:
+            arg = arg.lower()
+            has_python = has_python or "python" in arg
+            has_mcp = has_mcp or "mcp_ollama_python" in arg
+            if has_python and has_mcp:
+                break
+        is_mcp = has_python and has_mcp
         logger.debug("PID %d is MCP server: %s", pid, is_mcp)
         return is_mcp
     except psutil.NoSuchProcess:
@@ -93,39 +174,77 @@ def cleanup_stale_pipe_files(current_pid: Optional[int] = None) -> None:
     Remove all pipe files that don't correspond to the running MCP server.
 
     Args:
-        current_pid: PID of the currently running server (if any)
+        current_pid: PID of the currently running server (if any); the caller
+            must already have verified it with is_mcp_server_process()
     """
+    global _pipes_swept, _swept_pid
+
+    # Each command runs in a fresh process, so one sweep per current_pid is
+    # enough until stop_server changes the picture
+    if _pipes_swept and current_pid == _swept_pid:
+        logger.debug("Pipe files already swept in this run")
+        return
+
     logger.debug("Cleaning up stale pipe files (current_pid=%s)", current_pid)
     try:
-        for pipe_file in TMP_DIR.glob(".mcp_ollama_server_*.pipe"):
-            try:
-                filename = pipe_file.name
-                pid_str = filename.replace(".mcp_ollama_server_", "").replace(
-                    ".pipe", ""
-                )
-                file_pid = int(pid_str)
-
-                if file_pid != current_pid or not is_mcp_server_process(file_pid):
+        # One directory read; entries are matched by name without building
+        # Path objects or stat()ing them
+        with os.scandir(_TMP_DIR_STR) as entries:
+            for entry in entries:
+                filename = entry.name
+                if not (
+                    filename.startswith(_PIPE_PREFIX)
+                    and filename.endswith(_PIPE_SUFFIX)
+                ):
+                    continue
+                try:
+                    pid_str = filename[len(_PIPE_PREFIX) : -len(_PIPE_SUFFIX)]
+                    file_pid = int(pid_str)
+
+                    # Only the caller-verified server PID keeps its pipe file,
+                    # so the sweep never has to inspect processes itself
+                    if file_pid != current_pid:
+                        try:
+                            os.unlink(entry.path)
+                            logger.info("Cleaned up stale pipe file: %s", filename)
+                        except OSError as e:
+                            logger.warning("Could not remove %s: %s", filename, e)
+                except ValueError as e:
+                    logger.debug("Invalid PID in pipe filename %s: %s", filename, e)
                     try:
-                        pipe_file.unlink()
-                        logger.info("Cleaned up stale pipe file: %s", pipe_file.name)
+                        os.unlink(entry.path)
+                        logger.info("Cleaned up invalid pipe file: %s", filename)
                     except OSError as e:
-                        logger.warning("Could not remove %s: %s", pipe_file.name, e)
-            except ValueError as e:
-                logger.debug("Invalid PID in pipe filename %s: %s", pipe_file.name, e)
-                try:
-                    pipe_file.unlink()
-                    logger.info("Cleaned up invalid pipe file: %s", pipe_file.name)
-                except OSError as e:
-                    logger.warning(
-                        "Could not remove invalid pipe file %s: %s", pipe_file.name, e
-                    )
-            except OSError as e:
-                logger.warning("Error processing pipe file %s: %s", pipe_file.name, e)
+                        logger.warning(
+                            "Could not remove invalid pipe file %s: %s", filename, e
+                        )
+        _pipes_swept, _swept_pid = True, current_pid
+    except FileNotFoundError:
+        logger.debug("No tmp directory, nothing to clean up")
     except OSError as e:
         logger.error("Error during pipe cleanup: %s", e, exc_info=True)
 
 
+def _forget_pipe_sweep() -> None:
+    """Make the next cleanup_stale_pipe_files() call scan the directory."""
+    global _pipes_swept
+    _pipes_swept = False
+
+
+def _note_pipe_removed(pid: int) -> None:
+    """
+    Record that the pipe file the last sweep kept for pid is gone.
+
+    Args:
+        pid: PID whose pipe file was removed
+    """
+    global _swept_pid
+    # The directory now holds no pipe files at all, which is what a sweep
+    # with current_pid=None would have left
+    if _pipes_swept and _swept_pid == pid:
+        _swept_pid = None
+
+
 def get_server_pid() -> Optional[int]:
     """
     Get the PID of the running server if it exists and is valid.
@@ -134,31 +253,63 @@ def get_server_pid() -> Optional[int]:
         The PID of the running server, or None if not running
     """
     logger.debug("Getting server PID from %s", PID_FILE)
-    if PID_FILE.exists():
-        try:
-            pid = int(PID_FILE.read_text().strip())
-            logger.debug("Found PID %d in PID file", pid)
-
-            if is_mcp_server_process(pid):
-                cleanup_stale_pipe_files(current_pid=pid)
-                logger.debug("Server is running with PID %d", pid)
-                return pid
-            else:
-                logger.info("Found stale PID file, cleaning up")
-                PID_FILE.unlink()
-                cleanup_stale_pipe_files()
-                return None
-        except ValueError as e:
-            logger.warning("Invalid PID in file: %s", e)
-            return None
-        except FileNotFoundError:
-            logger.debug("PID file disappeared during read")
-            return None
-
+    try:
+        # One open+read; a PID is a handful of ASCII digits, and int()
+        # accepts bytes and ignores surrounding whitespace
+        with open(_PID_FILE_STR, "rb", buffering=0) as f:
+            pid = int(f.read(32))
+    except FileNotFoundError:
+        cleanup_stale_pipe_files()
+        return None
+    except ValueError as e:
+        logger.warning("Invalid PID in file: %s", e)
+        return None
+
+    logger.debug("Found PID %d in PID file", pid)
+    if is_mcp_server_process(pid):
+        cleanup_stale_pipe_files(current_pid=pid)
+        logger.debug("Server is running with PID %d", pid)
+        return pid
+
+    logger.info("Found stale PID file, cleaning up")
+    PID_FILE.unlink(missing_ok=True)
     cleanup_stale_pipe_files()
     return None
 
 
+def _claim_pid_file(pid: int) -> Optional[int]:
+    """
+    Create the PID file for pid exclusively, with mode 0600 from the start.
+
+    A leftover file (invalid, or naming a process that is no longer an MCP
+    server) is replaced once.
+
+    Args:
+        pid: PID of the newly started server
+
+    Returns:
+        None once the file holds pid, or the PID of another running server
+        that already owns the file
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY
+    try:
+        fd = os.open(_PID_FILE_STR, flags, 0o600)
+    except FileExistsError:
+        other_pid = get_server_pid()
+        if other_pid is not None:
+            return other_pid
+        PID_FILE.unlink(missing_ok=True)
+        fd = os.open(_PID_FILE_STR, flags, 0o600)
+    try:
+        os.write(fd, str(pid).encode())
+    finally:
+        os.close(fd)
+    return None
+
+
 def start_server() -> int:
     """
     Start the MCP server.
@@ -166,6 +317,8 @@ def start_server() -> int:
     Returns:
         0 on success, 1 on failure
     """
+    global _server_proc
+
     logger.info("Starting MCP server")
     existing_pid = get_server_pid()
     if existing_pid:
@@ -174,58 +327,87 @@ def start_server() -> int:
         print(f"PID: {existing_pid}")
         return 1
 
+    # Only starting writes to the data directory; status, stop and help
+    # cope with it not existing yet
+    try:
+        _ensure_dirs()
+    except OSError as e:
+        print(f"✗ Failed to initialize: {e}")
+        return 1
+
     print("Starting Ollama MCP Server...")
     logger.info("Cleaning up stale files")
     print("  Cleaning up stale files...")
     cleanup_stale_pipe_files()
 
+    log_fd = -1
     try:
+        LOGS_DIR.mkdir(parents=True, exist_ok=True)
+        log_fd = os.open(SERVER_LOG_FILE, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+        log_start = os.lseek(log_fd, 0, os.SEEK_END)
+
         logger.debug("Starting subprocess: %s -m mcp_ollama_python", sys.executable)
         process = subprocess.Popen(
             [sys.executable, "-m", "mcp_ollama_python"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
+            stdout=log_fd,
+            stderr=log_fd,
             start_new_session=True,
         )
-
-        PID_FILE.write_text(str(process.pid))
-        # Set restrictive permissions on PID file
-        os.chmod(PID_FILE, 0o600)
+        # The child holds its own copy; the parent needs none
+        os.close(log_fd)
+        log_fd = -1
+
+        other_pid = _claim_pid_file(process.pid)
+        if other_pid is not None:
+            # Lost a race with a concurrent start; keep the other server
+            logger.warning("Server was started concurrently with PID %d", other_pid)
+            process.kill()
+            process.wait()
+            print("Server is already running!")
+            print(f"PID: {other_pid}")
+            return 1
         logger.debug("Wrote PID %d to %s", process.pid, PID_FILE)
 
-        time.sleep(1)
+        # A server that dies on startup ends the wait at once; a healthy one
+        # is given the full grace period
+        if wait_for_exit(process.pid, START_GRACE_PERIOD) is None:
+            try:
+                process.wait(timeout=START_GRACE_PERIOD)
+            except subprocess.TimeoutExpired:
+                pass
 
         if process.poll() is None:
+            _server_proc = process
             logger.info("Server started successfully with PID %d", process.pid)
             print(f"✓ Server started successfully (PID: {process.pid})")
             print(f"  PID file: {PID_FILE}")
+            print(f"  Log file: {SERVER_LOG_FILE}")
             print("Use 'mcp-server-control stop' to stop the server")
             return 0
         else:
-            _, stderr = process.communicate()
-            logger.error(
-                "Server failed to start: %s",
-                stderr.decode() if stderr else "Unknown error",
-            )
+            with open(SERVER_LOG_FILE, "rb") as f:
+                f.seek(log_start)
+                output = f.read().decode(errors="replace")
+            logger.error("Server failed to start: %s", output or "Unknown error")
             print("✗ Server failed to start")
-            if stderr:
-                print(f"Error: {stderr.decode()}")
-            if PID_FILE.exists():
-                PID_FILE.unlink()
+            if output:
+                print(f"Error: {output}")
+            PID_FILE.unlink(missing_ok=True)
             return 1
 
     except subprocess.SubprocessError as e:
         logger.error("Failed to start subprocess: %s", e, exc_info=True)
         print(f"✗ Failed to start server: {e}")
-        if PID_FILE.exists():
-            PID_FILE.unlink()
+        PID_FILE.unlink(missing_ok=True)
         return 1
     except OSError as e:
         logger.error("OS error during server start: %s", e, exc_info=True)
         print(f"✗ Failed to start server: {e}")
-        if PID_FILE.exists():
-            PID_FILE.unlink()
+        PID_FILE.unlink(missing_ok=True)
         return 1
+    finally:
+        if log_fd >= 0:
+            os.close(log_fd)
 
 
 def stop_server() -> int:
@@ -235,6 +417,8 @@ def stop_server() -> int:
     Returns:
         0 on success, 1 on failure
     """
+    global _server_proc
+
     logger.info("Stopping MCP server")
     pid = get_server_pid()
 
@@ -248,28 +432,46 @@ def stop_server() -> int:
     logger.info("Stopping server with PID %d", pid)
     print(f"Stopping server (PID: {pid})...")
 
+    import psutil
+
     try:
         # Remove the pipe file to signal EOF to the child process.
-        pipe_file = TMP_DIR / f".mcp_ollama_server_{pid}.pipe"
-        if pipe_file.exists():
-            try:
-                pipe_file.unlink()
-                logger.debug("Removed pipe file for PID %d", pid)
-                print("  Removed pipe file")
-            except OSError as e:
-                logger.warning("Could not remove pipe file: %s", e)
+        pipe_file = f"{_TMP_DIR_STR}{os.sep}{_PIPE_PREFIX}{pid}{_PIPE_SUFFIX}"
+        try:
+            os.unlink(pipe_file)
+            logger.debug("Removed pipe file for PID %d", pid)
+            print("  Removed pipe file")
+            _note_pipe_removed(pid)
+        except FileNotFoundError:
+            _note_pipe_removed(pid)
+        except OSError as e:
+            logger.warning("Could not remove pipe file: %s", e)
 
         logger.debug("Sending SIGTERM to PID %d", pid)
         os.kill(pid, signal.SIGTERM)
 
-        # Wait for graceful shutdown (up to 5 seconds)
-        for i in range(50):
+        # Wait for graceful shutdown (up to 5 seconds), sleeping on the exit
+        # event where the platform offers one
+        exited = wait_for_exit(pid, 5.0)
+        child = _server_proc
+        if child is not None and child.pid == pid:
+            # A server started by this process lingers as a zombie, which
+            # still answers os.kill(pid, 0), until it is reaped
             try:
-                os.kill(pid, 0)
-                time.sleep(0.1)
-            except OSError:
-                logger.debug("Process stopped after %d iterations", i)
-                break
+                child.wait(timeout=5.0 if exited is None else 0)
+                _server_proc = None
+            except subprocess.TimeoutExpired:
+                logger.debug("Started server %d has not exited yet", pid)
+        elif exited is None:
+            for i in range(50):
+                try:
+                    os.kill(pid, 0)
+                    time.sleep(0.1)
+                except OSError:
+                    logger.debug("Process stopped after %d iterations", i)
+                    break
+        else:
+            logger.debug("Process exited within timeout: %s", exited)
 
         # Check if process is still running
         try:
@@ -291,12 +493,13 @@ def stop_server() -> int:
         except OSError:
             logger.debug("Process already stopped")
 
-        if PID_FILE.exists():
-            PID_FILE.unlink()
-            logger.debug("Removed PID file")
+        PID_FILE.unlink(missing_ok=True)
+        logger.debug("Removed PID file")
 
         logger.info("Cleaning up temporary files")
         print("  Cleaning up temporary files...")
+        # Rescans only if the sweep in get_server_pid() or the pipe removal
+        # above did not complete
         cleanup_stale_pipe_files()
 
         logger.info("Server stopped successfully")
@@ -306,15 +509,15 @@ def stop_server() -> int:
     except OSError as e:
         logger.error("OS error while stopping server: %s", e, exc_info=True)
         print(f"✗ Failed to stop server: {e}")
-        if PID_FILE.exists():
-            PID_FILE.unlink()
+        PID_FILE.unlink(missing_ok=True)
+        _forget_pipe_sweep()
         cleanup_stale_pipe_files()
         return 1
     except psutil.Error as e:
         logger.error("psutil error while stopping server: %s", e, exc_info=True)
         print(f"✗ Failed to stop server: {e}")
-        if PID_FILE.exists():
-            PID_FILE.unlink()
+        PID_FILE.unlink(missing_ok=True)
+        _forget_pipe_sweep()
         cleanup_stale_pipe_files()
         return 1
 
@@ -383,6 +586,16 @@ Examples:
     return 0
 
 
+# Command-line verbs and their handlers
+_COMMANDS: Dict[str, Callable[[], int]] = {
+    "start": start_server,
+    "stop": stop_server,
+    "restart": restart_server,
+    "status": server_status,
+    "help": show_help,
+}
+
+
 def main() -> int:
     """
     Main entry point.
@@ -391,13 +604,6 @@ def main() -> int:
         Exit code (0 for success, 1 for failure)
     """
     logger.debug("Starting server control script")
-    try:
-        _ensure_dirs()
-    except OSError as e:
-        logger.error("Failed to initialize: %s", e)
-        print(f"✗ Failed to initialize: {e}")
-        return 1
-
     if len(sys.argv) < 2:
         show_help()
         return 1
@@ -405,27 +611,20 @@ def main() -> int:
     command = sys.argv[1].lower()
     logger.debug("Executing command: %s", command)
 
-    commands = {
-        "start": start_server,
-        "stop": stop_server,
-        "restart": restart_server,
-        "status": server_status,
-        "help": show_help,
-    }
-
-    if command in commands:
-        try:
-            return commands[command]()
-        except Exception as e:
-            logger.error("Command %s failed: %s", command, e, exc_info=True)
-            print(f"✗ Command failed: {e}")
-            return 1
-    else:
+    handler = _COMMANDS.get(command)
+    if handler is None:
         logger.warning("Unknown command: %s", command)
         print(f"Unknown command: {command}")
         show_help()
         return 1
 
+    try:
+        return handler()
+    except Exception as e:
+        logger.error("Command %s failed: %s", command, e, exc_info=True)
+        print(f"✗ Command failed: {e}")
+        return 1
+
 
 if __name__ == "__main__":
     sys.exit(main())
@@ -5,11 +5,16 @@ from __future__ import annotations
 import ipaddress
 import os
 import re
+import string
 from typing import Optional
 from urllib.parse import urlparse
 
 MODEL_NAME_PATTERN = re.compile(r"^[a-zA-Z0-9][a-zA-Z0-9._:-]*$")
 
+# Character sets equivalent to MODEL_NAME_PATTERN, used for the fast check
+_MODEL_NAME_FIRST_CHARS = frozenset(string.ascii_letters + string.digits)
+_MODEL_NAME_CHARS = frozenset(string.ascii_letters + string.digits + "._:-")
+
 ALLOWED_ENV_VARS = frozenset(
     {
         "OLLAMA_HOST",
@@ -107,7 +112,7 @@ def validate_ollama_host(
         raise ValueError("Host points to a blocked metadata endpoint")
 
     remote_ok = is_remote_host_allowed() if allow_remote is None else allow_remote
-    if not remote_ok and not _is_local_hostname(hostname):
+    if not remote_ok and not is_local_hostname(hostname):
         raise ValueError(
             "OLLAMA_HOST must use localhost/127.0.0.1. "
             "Set OLLAMA_ALLOW_REMOTE_HOST=1 to use a remote Ollama server."
@@ -122,7 +127,8 @@ def validate_ollama_host(
     return host.rstrip("/")
 
 
-def _is_local_hostname(hostname: str) -> bool:
+def is_local_hostname(hostname: str) -> bool:
+    """Return True for loopback addresses and localhost-style hostnames."""
     bare = hostname.strip("[]")
     if bare.lower() in _LOCAL_HOSTNAMES:
         return True
@@ -144,12 +150,21 @@ def _reject_link_local_or_metadata_ip(hostname: str) -> None:
         raise ValueError("Host points to a blocked metadata endpoint")
 
 
+def _is_valid_model_name(name: str) -> bool:
+    """Set-based equivalent of MODEL_NAME_PATTERN without regex overhead."""
+    return (
+        bool(name)
+        and name[0] in _MODEL_NAME_FIRST_CHARS
+        and _MODEL_NAME_CHARS.issuperset(name)
+    )
+
+
 def validate_model_name(model: str) -> str:
     """Validate Ollama model identifiers."""
     if not model or not isinstance(model, str):
         raise ValueError("Model name must be a non-empty string")
     clean = model.strip()
-    if not MODEL_NAME_PATTERN.match(clean):
+    if not _is_valid_model_name(clean):
         raise ValueError(
             f"Invalid model name '{clean}'. Must start with alphanumeric "
             "and contain only alphanumeric, dots, underscores, hyphens, or colons."
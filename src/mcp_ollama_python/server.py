@@ -5,16 +5,18 @@ MCP Server implementation for Ollama
 from dataclasses import dataclass
 import json
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 try:
     from mcp_ollama_python.ollama_client import OllamaClient
     from mcp_ollama_python.autoloader import discover_tools_with_handlers, ToolRegistry
     from mcp_ollama_python.models import ResponseFormat
+    from mcp_ollama_python.json_utils import dumps_indented, loads
 except ImportError:
     from .ollama_client import OllamaClient
     from .autoloader import discover_tools_with_handlers, ToolRegistry
     from .models import ResponseFormat
+    from .json_utils import dumps_indented, loads
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -33,6 +35,123 @@ PROMPT_HELLO_WORLD = "hello_world"
 PROMPT_EXPLAIN_CODE = "explain_code"
 PROMPT_WRITE_DOCSTRING = "write_docstring"
 
+# Prompt texts, filled in with str.format
+_EXPLAIN_LORA_TEMPLATE = """Explain LoRA (Low-Rank Adaptation) at a {detail} level.
+Include:
+- What it is and why it's useful
+- How it works technically
+- Use cases and benefits
+- Comparison with full fine-tuning"""
+
+_CODE_REVIEW_TEMPLATE = """Review the following {language} code with focus on identifying potential bugs and correctness issues.
+You are a senior software engineer performing a deep code review. Your analysis should emphasize:
+
+1. Logic flaws or incorrect behavior
+2. Missing or unhandled edge cases
+3. Null/undefined reference risks
+4. Concurrency or race‑condition vulnerabilities
+5. Security weaknesses
+6. Resource‑management issues or leaks
+7. Violations of API contracts
+8. Incorrect or ineffective caching behavior (staleness, key bugs, invalidation issues)
+9. Inconsistencies with established patterns or conventions
+
+Additional requirements:
+- When exploring the codebase, use multiple tools in parallel for efficiency, but avoid excessive exploration.
+- Report any pre‑existing bugs you discover, not just those introduced by the changes.
+- Do not include speculative or low‑confidence findings; base conclusions on a solid understanding of the code.
+- Be aware that the referenced commit may not reflect the current local checkout state."""
+
+_HELLO_WORLD_TEMPLATE = """Write a complete, well-commented Hello World program in {language}.
+Include:
+- Proper syntax and structure
+- Comments explaining each part
+- Best practices for the language
+- How to run the program"""
+
+_EXPLAIN_CODE_TEMPLATE = """Explain the following code{lang_hint} in detail:
+
+```
+{code}
+```
+
+Provide a comprehensive explanation that includes:
+1. **Overview**: What does this code do at a high level?
+2. **Step-by-step breakdown**: Explain each significant part
+3. **Key concepts**: What programming concepts or patterns are used?
+4. **Inputs and outputs**: What does it expect and what does it produce?
+5. **Potential issues**: Any edge cases, bugs, or improvements to consider?
+
+Be clear and educational in your explanation."""
+
+_WRITE_DOCSTRING_TEMPLATE = """Generate comprehensive documentation{style_hint} for the following {language} code:
+
+```{language}
+{code}
+```
+
+Requirements:
+1. Write proper docstring/documentation comments appropriate for {language}
+2. Include:
+   - Brief description of what the code does
+   - Parameters/arguments with types and descriptions
+   - Return value with type and description
+   - Exceptions/errors that may be raised
+   - Usage examples if applicable
+   - Any important notes or warnings
+3. Follow {language} documentation conventions{style_hint}
+4. Be clear, concise, and complete
+
+Provide ONLY the documentation/docstring, formatted correctly for insertion into the code."""
+
+
+def _explain_lora_prompt(args: Dict[str, str]) -> str:
+    """Build the explain_lora prompt."""
+    return _EXPLAIN_LORA_TEMPLATE.format(detail=args.get("detail_level", "basic"))
+
+
+def _code_review_prompt(args: Dict[str, str]) -> str:
+    """Build the code_review prompt."""
+    return _CODE_REVIEW_TEMPLATE.format(language=args.get("language", "Python"))
+
+
+def _hello_world_prompt(args: Dict[str, str]) -> str:
+    """Build the hello_world prompt."""
+    return _HELLO_WORLD_TEMPLATE.format(language=args.get("language", "Python"))
+
+
+def _explain_code_prompt(args: Dict[str, str]) -> str:
+    """Build the explain_code prompt; the code argument is required."""
+    code = args.get("code", "")
+    if not code:
+        raise ValueError("The 'code' parameter is required for explain_code prompt")
+    language = args.get("language", "")
+    lang_hint = f" ({language})" if language else ""
+    return _EXPLAIN_CODE_TEMPLATE.format(code=code, lang_hint=lang_hint)
+
+
+def _write_docstring_prompt(args: Dict[str, str]) -> str:
+    """Build the write_docstring prompt; the code argument is required."""
+    code = args.get("code", "")
+    if not code:
+        raise ValueError("The 'code' parameter is required for write_docstring prompt")
+    language = args.get("language", "python")
+    style = args.get("style", "")
+    style_hint = f" in {style} style" if style else ""
+    return _WRITE_DOCSTRING_TEMPLATE.format(
+        code=code, language=language, style_hint=style_hint
+    )
+
+
+# Prompt name -> builder turning the request arguments into the prompt text
+_PROMPT_BUILDERS: Dict[str, Callable[[Dict[str, str]], str]] = {
+    PROMPT_EXPLAIN_LORA: _explain_lora_prompt,
+    PROMPT_CODE_REVIEW: _code_review_prompt,
+    PROMPT_HELLO_WORLD: _hello_world_prompt,
+    PROMPT_EXPLAIN_CODE: _explain_code_prompt,
+    PROMPT_WRITE_DOCSTRING: _write_docstring_prompt,
+}
+
 
 @dataclass
 class ResourceDefinition:
@@ -120,7 +239,7 @@ class OllamaMCPServer:
             structured_data = None
             if isinstance(result, str) and result.strip():
                 try:
-                    structured_data = json.loads(result)
+                    structured_data = loads(result)
                 except (json.JSONDecodeError, TypeError):
                     logger.debug("Failed to parse structured data from tool %s", name)
 
@@ -299,18 +418,18 @@ class OllamaMCPServer:
             resource = self._resources[uri]
 
             # Fetch the actual resource data
+            # Model listings are passed through as Ollama sent them, without
+            # a parse/serialize round trip
             if uri == RESOURCE_URI_MODELS:
-                data = await self.ollama_client.list()
-                content = json.dumps(data, indent=2)
+                content = (await self.ollama_client.list_raw()).decode()
             elif uri == RESOURCE_URI_RUNNING:
-                data = await self.ollama_client.ps()
-                content = json.dumps(data, indent=2)
+                content = (await self.ollama_client.ps_raw()).decode()
             elif uri == RESOURCE_URI_CONFIG:
                 config_data = {
                     "host": self.ollama_client.host,
                     "has_api_key": bool(self.ollama_client.api_key),
                 }
-                content = json.dumps(config_data, indent=2)
+                content = dumps_indented(config_data)
             else:
                 content = "Resource data not available"
 
@@ -369,93 +488,9 @@ class OllamaMCPServer:
             prompt_def = self._prompts[name]
             args = arguments or {}
 
-            # Generate prompt based on name
-            if name == PROMPT_EXPLAIN_LORA:
-                detail = args.get("detail_level", "basic")
-                prompt_text = f"""Explain LoRA (Low-Rank Adaptation) at a {detail} level.
-Include:
-- What it is and why it's useful
-- How it works technically
-- Use cases and benefits
-- Comparison with full fine-tuning"""
-            elif name == PROMPT_CODE_REVIEW:
-                language = args.get("language", "Python")
-                prompt_text = f"""Review the following {language} code with focus on identifying potential bugs and correctness issues.
-You are a senior software engineer performing a deep code review. Your analysis should emphasize:
-
-1. Logic flaws or incorrect behavior
-2. Missing or unhandled edge cases
-3. Null/undefined reference risks
-4. Concurrency or race‑condition vulnerabilities
-5. Security weaknesses
-6. Resource‑management issues or leaks
-7. Violations of API contracts
-8. Incorrect or ineffective caching behavior (staleness, key bugs, invalidation issues)
-9. Inconsistencies with established patterns or conventions
-
-Additional requirements:
-- When exploring the codebase, use multiple tools in parallel for efficiency, but avoid excessive exploration.
-- Report any pre‑existing bugs you discover, not just those introduced by the changes.
-- Do not include speculative or low‑confidence findings; base conclusions on a solid understanding of the code.
-- Be aware that the referenced commit may not reflect the current local checkout state."""
-            elif name == PROMPT_HELLO_WORLD:
-                language = args.get("language", "Python")
-                prompt_text = f"""Write a complete, well-commented Hello World program in {language}.
-Include:
-- Proper syntax and structure
-- Comments explaining each part
-- Best practices for the language
-- How to run the program"""
-            elif name == PROMPT_EXPLAIN_CODE:
-                code = args.get("code", "")
-                if not code:
-                    raise ValueError(
-                        "The 'code' parameter is required for explain_code prompt"
-                    )
-                language = args.get("language", "")
-                lang_hint = f" ({language})" if language else ""
-                prompt_text = f"""Explain the following code{lang_hint} in detail:
-
-```
-{code}
-```
-
-Provide a comprehensive explanation that includes:
-1. **Overview**: What does this code do at a high level?
-2. **Step-by-step breakdown**: Explain each significant part
-3. **Key concepts**: What programming concepts or patterns are used?
-4. **Inputs and outputs**: What does it expect and what does it produce?
-5. **Potential issues**: Any edge cases, bugs, or improvements to consider?
-
-Be clear and educational in your explanation."""
-            elif name == PROMPT_WRITE_DOCSTRING:
-                code = args.get("code", "")
-                if not code:
-                    raise ValueError(
-                        "The 'code' parameter is required for write_docstring prompt"
-                    )
-                language = args.get("language", "python")
-                style = args.get("style", "")
-                style_hint = f" in {style} style" if style else ""
-                prompt_text = f"""Generate comprehensive documentation{style_hint} for the following {language} code:
-
-```{language}
-{code}
-```
-
-Requirements:
-1. Write proper docstring/documentation comments appropriate for {language}
-2. Include:
-   - Brief description of what the code does
-   - Parameters/arguments with types and descriptions
-   - Return value with type and description
-   - Exceptions/errors that may be raised
-   - Usage examples if applicable
-   - Any important notes or warnings
-3. Follow {language} documentation conventions{style_hint}
-4. Be clear, concise, and complete
-
-Provide ONLY the documentation/docstring, formatted correctly for insertion into the code."""
+            builder = _PROMPT_BUILDERS.get(name)
+            if builder is not None:
+                prompt_text = builder(args)
             else:
                 prompt_text = f"Prompt template for {name}"
 
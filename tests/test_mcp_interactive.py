@@ -0,0 +1,221 @@
+"""
+Tests for scripts/mcp_interactive.py - interactive server manager
+"""
+
+import os
+import stat
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+from mcp_ollama_python.scripts import mcp_interactive
+
+
+@pytest.fixture
+def data_dirs(tmp_path, monkeypatch):
+    """Point the manager's data files at a temporary directory"""
+    tmp_dir = tmp_path / "tmp"
+    logs_dir = tmp_path / "logs"
+    tmp_dir.mkdir()
+    logs_dir.mkdir()
+    monkeypatch.setattr(mcp_interactive, "TMP_DIR", tmp_dir)
+    monkeypatch.setattr(mcp_interactive, "LOGS_DIR", logs_dir)
+    monkeypatch.setattr(mcp_interactive, "PID_FILE", tmp_dir / "server.pid")
+    monkeypatch.setattr(mcp_interactive, "ENV_VARS_FILE", tmp_dir / "env.json")
+    monkeypatch.setattr(mcp_interactive, "LOG_FILE", logs_dir / "server.log")
+    monkeypatch.setattr(
+        mcp_interactive, "ERROR_LOG_FILE", logs_dir / "server_error.log"
+    )
+    monkeypatch.setattr(
+        mcp_interactive, "PREVIOUS_LOG_FILE", logs_dir / "server.log.1"
+    )
+    monkeypatch.setattr(
+        mcp_interactive, "PREVIOUS_ERROR_LOG_FILE", logs_dir / "server_error.log.1"
+    )
+    return tmp_path
+
+
+@pytest.fixture
+def manager(data_dirs):
+    """An MCPInteractive instance using the temporary data directory"""
+    instance = mcp_interactive.MCPInteractive()
+    yield instance
+    for fd in instance._stdin_pipes.values():
+        os.close(fd)
+    instance.close()
+
+
+class TestPrintLogFile:
+    """Tests for _print_log_file"""
+
+    def test_tail_skips_partial_first_line(self, tmp_path, capsys):
+        """Test the tail starts at the next full line and reports its size"""
+        log = tmp_path / "server.log"
+        log.write_bytes(b"line1\nline2\nline3\n")
+
+        mcp_interactive._print_log_file(log, "HEADER", "empty", tail_bytes=8)
+
+        out = capsys.readouterr().out
+        assert out == (
+            "HEADER\n... (truncated, showing last 6 of 18 bytes)\nline3\n\n"
+        )
+
+    def test_tail_of_single_long_line(self, tmp_path, capsys):
+        """Test a tail inside one long line is shown from the cut"""
+        log = tmp_path / "server.log"
+        log.write_bytes(b"x" * 100)
+
+        mcp_interactive._print_log_file(log, "HEADER", "empty", tail_bytes=10)
+
+        out = capsys.readouterr().out
+        assert "showing last 10 of 100 bytes" in out
+        assert out.endswith("\n" + "x" * 10 + "\n")
+
+    def test_whitespace_only_file_is_empty(self, tmp_path, capsys):
+        """Test a file holding only whitespace prints the empty message"""
+        log = tmp_path / "server.log"
+        log.write_bytes(b"  \n\n\t\n")
+
+        mcp_interactive._print_log_file(log, "HEADER", "(empty)")
+
+        assert capsys.readouterr().out == "(empty)\n"
+
+    @pytest.mark.skipif(not hasattr(os, "sendfile"), reason="requires os.sendfile")
+    @pytest.mark.parametrize("sendfile_fails", [False, True])
+    def test_copy_to_redirected_stdout(
+        self, tmp_path, monkeypatch, sendfile_fails
+    ):
+        """Test stdout redirected to a file gets the whole log, with or
+        without sendfile"""
+        content = b"  \nfirst line\n" + b"more output\n" * 50
+        log = tmp_path / "server.log"
+        log.write_bytes(content)
+        monkeypatch.setattr(mcp_interactive, "LOG_CHUNK_SIZE", 4)
+
+        calls = []
+        real_sendfile = os.sendfile
+
+        def sendfile(*args):
+            calls.append(args)
+            if sendfile_fails:
+                raise OSError("sendfile not supported")
+            return real_sendfile(*args)
+
+        monkeypatch.setattr(os, "sendfile", sendfile)
+
+        out_path = tmp_path / "out.txt"
+        with open(out_path, "w", encoding="utf-8") as out, monkeypatch.context() as m:
+            m.setattr(sys, "stdout", out)
+            mcp_interactive._print_log_file(log, "HEADER", "empty")
+
+        assert calls
+        assert out_path.read_bytes() == b"HEADER\n" + content + b"\n"
+
+
+class TestRotateLog:
+    """Tests for _rotate_log"""
+
+    def test_non_empty_log_replaces_previous(self, tmp_path):
+        """Test a non-empty log is moved over the previous one"""
+        log = tmp_path / "server.log"
+        previous = tmp_path / "server.log.1"
+        log.write_text("new run")
+        previous.write_text("old run")
+
+        mcp_interactive._rotate_log(log, previous)
+
+        assert not log.exists()
+        assert previous.read_text() == "new run"
+
+    def test_empty_log_is_kept(self, tmp_path):
+        """Test an empty log does not replace the previous one"""
+        log = tmp_path / "server.log"
+        previous = tmp_path / "server.log.1"
+        log.write_text("")
+        previous.write_text("old run")
+
+        mcp_interactive._rotate_log(log, previous)
+
+        assert log.exists()
+        assert previous.read_text() == "old run"
+
+    def test_missing_log_is_ignored(self, tmp_path):
+        """Test a missing log is not an error"""
+        mcp_interactive._rotate_log(tmp_path / "missing.log", tmp_path / "x.1")
+        assert not (tmp_path / "x.1").exists()
+
+
+class TestSaveEnvVars:
+    """Tests for MCPInteractive.save_env_vars"""
+
+    def test_writes_changes_with_private_mode(self, manager):
+        """Test changed variables are written to a 0600 file"""
+        manager.env_vars["OLLAMA_HOST"] = "http://127.0.0.1:11434"
+        manager.save_env_vars()
+
+        env_file = mcp_interactive.ENV_VARS_FILE
+        assert stat.S_IMODE(env_file.stat().st_mode) == 0o600
+        assert manager.load_env_vars() == {"OLLAMA_HOST": "http://127.0.0.1:11434"}
+        assert not env_file.with_name(env_file.name + ".tmp").exists()
+
+    def test_unchanged_variables_are_not_written(self, manager, monkeypatch):
+        """Test saving without changes leaves the file alone"""
+        manager.save_env_vars()
+        assert not mcp_interactive.ENV_VARS_FILE.exists()
+
+        manager.env_vars["OLLAMA_HOST"] = "http://127.0.0.1:11434"
+        manager.save_env_vars()
+
+        replace = MagicMock()
+        monkeypatch.setattr(mcp_interactive.os, "replace", replace)
+        manager.save_env_vars()
+        replace.assert_not_called()
+
+
+class TestPidCache:
+    """Tests for MCPInteractive.get_pid_info"""
+
+    def test_lookup_reused_within_ttl(self, manager, monkeypatch):
+        """Test repeat lookups within PID_CACHE_TTL reuse the first result"""
+        read = MagicMock(return_value=mcp_interactive.PidInfo(stored_pid=123))
+        monkeypatch.setattr(manager, "_read_pid_info", read)
+
+        first = manager.get_pid_info()
+        assert manager.get_pid_info() is first
+        read.assert_called_once()
+
+    def test_expired_lookup_is_repeated(self, manager, monkeypatch):
+        """Test a lookup older than PID_CACHE_TTL is made again"""
+        fresh = mcp_interactive.PidInfo(stored_pid=456)
+        monkeypatch.setattr(manager, "_read_pid_info", MagicMock(return_value=fresh))
+        checked_at = mcp_interactive.time.monotonic() - mcp_interactive.PID_CACHE_TTL
+        manager._pid_cache = (checked_at - 1, mcp_interactive.PidInfo(stored_pid=123))
+
+        assert manager.get_pid_info() is fresh
+
+
+class TestStartServer:
+    """Tests for MCPInteractive.start_server"""
+
+    def test_ready_marker_ends_wait(self, manager, monkeypatch):
+        """Test start_server stops waiting once the log shows the ready marker"""
+        monkeypatch.setattr(manager, "get_server_pid", lambda: None)
+        monkeypatch.setattr("builtins.input", lambda prompt="": "")
+        process = MagicMock(pid=12345)
+        process.poll.return_value = None
+
+        def popen(*args, **kwargs):
+            kwargs["stdout"].write(mcp_interactive.SERVER_READY_MARKER.decode())
+            kwargs["stdout"].flush()
+            return process
+
+        sleep = MagicMock()
+        monkeypatch.setattr(mcp_interactive.subprocess, "Popen", popen)
+        monkeypatch.setattr(mcp_interactive.time, "sleep", sleep)
+
+        manager.start_server()
+
+        sleep.assert_not_called()
+        assert mcp_interactive.PID_FILE.read_text() == "12345"
+        assert manager._server_proc is process
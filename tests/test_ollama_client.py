@@ -2,6 +2,7 @@
 Tests for ollama_client.py - Ollama HTTP client wrapper
 """
 
+import json
 import os
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -140,7 +141,7 @@ class TestOllamaClientListModels:
         """Test listing models"""
         with patch('httpx.AsyncClient') as mock_client_class:
             mock_response = MagicMock()
-            mock_response.json.return_value = mock_ollama_response_list
+            mock_response.content = json.dumps(mock_ollama_response_list).encode()
             mock_response.raise_for_status = MagicMock()
 
             mock_client = AsyncMock()
@@ -155,6 +156,26 @@ class TestOllamaClientListModels:
             assert len(result["models"]) == 2
             mock_client.get.assert_called_once_with("/api/tags")
 
+    @pytest.mark.asyncio
+    async def test_list_models_invalid_json(self):
+        """Test an unparsable body raises OllamaError"""
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_response = MagicMock()
+            mock_response.content = b"<html>not json</html>"
+            mock_response.raise_for_status = MagicMock()
+
+            mock_client = AsyncMock()
+            mock_client.get = AsyncMock(return_value=mock_response)
+            mock_client_class.return_value = mock_client
+
+            from mcp_ollama_python.models import OllamaError
+            from mcp_ollama_python.ollama_client import OllamaClient
+
+            client = OllamaClient()
+
+            with pytest.raises(OllamaError, match="Invalid JSON response"):
+                await client.list()
+
 
 class TestOllamaClientShowModel:
     """Tests for show method"""
@@ -346,7 +367,7 @@ class TestOllamaClientModelManagement:
         """Test listing running models"""
         with patch('httpx.AsyncClient') as mock_client_class:
             mock_response = MagicMock()
-            mock_response.json.return_value = mock_ollama_response_ps
+            mock_response.content = json.dumps(mock_ollama_response_ps).encode()
             mock_response.raise_for_status = MagicMock()
 
             mock_client = AsyncMock()
@@ -360,6 +381,27 @@ class TestOllamaClientModelManagement:
             assert "models" in result
             mock_client.get.assert_called_once_with("/api/ps")
 
+    @pytest.mark.asyncio
+    async def test_ps_raw(self):
+        """Test listing running models as raw bytes"""
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_response = MagicMock()
+            mock_response.content = b'{"models":[]}'
+            mock_response.raise_for_status = MagicMock()
+
+            mock_client = AsyncMock()
+            mock_client.get = AsyncMock(return_value=mock_response)
+            mock_client_class.return_value = mock_client
+
+            from mcp_ollama_python.ollama_client import OllamaClient
+
+            client = OllamaClient()
+            result = await client.ps_raw()
+
+            assert result == b'{"models":[]}'
+            mock_response.json.assert_not_called()
+            mock_client.get.assert_called_once_with("/api/ps")
+
 
 class TestOllamaClientEmbeddings:
     """Tests for embed method"""
@@ -0,0 +1,38 @@
+"""
+Tests for scripts/process_utils.py - shared process helpers
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+from mcp_ollama_python.scripts.process_utils import wait_for_exit
+
+
+class TestWaitForExit:
+    """Tests for wait_for_exit"""
+
+    @pytest.fixture
+    def sleeper(self):
+        process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+        yield process
+        process.kill()
+        process.wait()
+
+    def test_timeout_while_running(self, sleeper):
+        """Test a running process times out as False (or None without support)"""
+        assert wait_for_exit(sleeper.pid, 0.05) in (False, None)
+
+    def test_exit_is_reported(self, sleeper):
+        """Test an exited but unreaped child is reported as exited"""
+        sleeper.kill()
+        result = wait_for_exit(sleeper.pid, 5.0)
+        assert result in (True, None)
+        sleeper.wait()
+
+    def test_reaped_process_counts_as_exited(self):
+        """Test a PID that no longer exists is reported as exited"""
+        process = subprocess.Popen([sys.executable, "-c", "pass"])
+        process.wait()
+        assert wait_for_exit(process.pid, 0.05) in (True, None)
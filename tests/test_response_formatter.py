@@ -3,13 +3,14 @@ Tests for response_formatter.py - Response formatting utilities
 """
 
 import json
+from collections import OrderedDict
 
 import pytest
 
 from mcp_ollama_python.models import ResponseFormat
 from mcp_ollama_python.response_formatter import (
-    _format_object_entry,
     array_to_markdown_table,
+    escape_markdown,
     format_response,
     json_to_markdown,
 )
@@ -33,6 +34,54 @@ class TestFormatResponse:
         assert "Invalid JSON content" in parsed["error"]
         assert parsed["raw_content"] == input_text
 
+    def test_json_format_serialized_array_passthrough(self):
+        """Test serialized arrays are returned unchanged in JSON format"""
+        input_json = '  [{"name": "llama3"}, {"name": "qwen"}]\n'
+        result = format_response(input_json, ResponseFormat.JSON)
+        assert result == input_json
+
+    @pytest.mark.parametrize("input_text", ["{not json}", "[WARN] disk [full]"])
+    def test_json_format_bracketed_text_is_validated(self, input_text):
+        """Test bracketed text that is not JSON is wrapped in an error"""
+        result = format_response(input_text, ResponseFormat.JSON)
+        parsed = json.loads(result)
+        assert parsed["error"] == "Invalid JSON content"
+        assert parsed["raw_content"] == input_text
+
+    def test_json_format_plain_text_with_digits(self):
+        """Test text resembling a JSON scalar is still validated"""
+        input_text = "1 apple"
+        result = format_response(input_text, ResponseFormat.JSON)
+        parsed = json.loads(result)
+        assert parsed["error"] == "Invalid JSON content"
+
+    def test_json_format_dict_indented(self):
+        """Test dict input is serialized as indented JSON"""
+        data = {"models": [{"name": "llama3", "size": 1}]}
+        result = format_response(data, ResponseFormat.JSON)
+        assert json.loads(result) == data
+        assert '\n  "models": [' in result
+
+    def test_json_format_wide_integer(self):
+        """Test integers beyond 64 bits still serialize"""
+        data = {"big": 2**70, 1: "int key"}
+        result = format_response(data, ResponseFormat.JSON)
+        assert json.loads(result) == {"big": 2**70, "1": "int key"}
+
+    def test_json_format_without_orjson(self, monkeypatch):
+        """Test the stdlib serializer is used when orjson is unavailable"""
+        from mcp_ollama_python import json_utils
+
+        monkeypatch.setattr(json_utils, "orjson", None)
+        data = {"key": "value"}
+        result = format_response(data, ResponseFormat.JSON)
+        assert result == json.dumps(data, indent=2)
+
+    def test_json_format_validated_passthrough(self):
+        """Test validated strings skip JSON validation entirely"""
+        trusted = '"already serialized"'
+        assert format_response(trusted, ResponseFormat.JSON, validated=True) == trusted
+
     def test_markdown_format_from_json(self):
         """Test markdown format converts JSON to markdown"""
         input_json = '{"name": "test", "value": 123}'
@@ -40,12 +89,57 @@ class TestFormatResponse:
         assert "**name:**" in result
         assert "**value:**" in result
 
+    def test_markdown_format_non_finite_numbers(self):
+        """Test stdlib-only JSON extensions such as NaN are still parsed"""
+        result = format_response('{"loss": NaN}', ResponseFormat.MARKDOWN)
+        assert result == "**loss:** nan"
+
     def test_markdown_format_plain_text(self):
         """Test markdown format returns plain text as-is"""
         input_text = "Plain text content"
         result = format_response(input_text, ResponseFormat.MARKDOWN)
         assert result == input_text
 
+    def test_plain_string_format_and_subclasses(self):
+        """Test inputs outside the dispatch table use the generic path"""
+        assert format_response({"a": 1}, "json") == '{\n  "a": 1\n}'
+        result = format_response(OrderedDict(a=1), ResponseFormat.MARKDOWN)
+        assert result == "**a:** 1"
+
+    def test_invalid_format_raises(self):
+        """Test unsupported formats are rejected"""
+        with pytest.raises(ValueError, match="Unsupported format"):
+            format_response({"a": 1}, "xml")
+
+    def test_unhashable_format_raises(self):
+        """Test unhashable formats are rejected as unsupported"""
+        with pytest.raises(ValueError, match="Unsupported format"):
+            format_response({"a": 1}, ["json"])
+
+
+class TestFormatResponseCache:
+    """Tests for caching of string responses"""
+
+    def test_repeated_string_served_from_cache(self):
+        """Test identical string payloads are formatted once"""
+        from mcp_ollama_python import response_formatter
+
+        response_formatter._format_str_cached.cache_clear()
+        payload = '{"status": "success"}'
+        first = format_response(payload, ResponseFormat.MARKDOWN)
+        second = format_response(payload, ResponseFormat.MARKDOWN)
+        assert first == second == "**status:** success"
+        assert response_formatter._format_str_cached.cache_info().hits == 1
+
+    def test_large_string_not_cached(self):
+        """Test payloads above the size limit bypass the cache"""
+        from mcp_ollama_python import response_formatter
+
+        response_formatter._format_str_cached.cache_clear()
+        payload = "x" * (response_formatter.FORMAT_CACHE_MAX_CHARS + 1)
+        assert format_response(payload, ResponseFormat.MARKDOWN) == payload
+        assert response_formatter._format_str_cached.cache_info().currsize == 0
+
 
 class TestJsonToMarkdown:
     """Tests for json_to_markdown function"""
@@ -125,6 +219,39 @@ class TestJsonToMarkdown:
         result = json_to_markdown({"key": "value"}, indent="  ")
         assert result.startswith("  ")
 
+    def test_nested_output_order(self):
+        """Test nested lists and objects render in document order"""
+        data = {"a": [1, {"b": None}], "c_d": {"e": "x|y"}}
+        result = json_to_markdown(data)
+        assert result == (
+            "**a:**\n  - 1\n  - **b:** None\n**c d:**\n  **e:** x\\|y"
+        )
+
+    def test_max_depth_exceeded(self):
+        """Test very deep nesting is cut off with a placeholder"""
+        data = []
+        node = data
+        for _ in range(500):
+            child = []
+            node.append(child)
+            node = child
+        result = json_to_markdown(data)
+        assert "_max depth exceeded_" in result
+
+    def test_shared_reference_without_cycle_check(self):
+        """Test disabling cycle checks renders repeated objects in full"""
+        shared = {"k": "v"}
+        result = json_to_markdown({"a": shared, "b": shared}, check_cycles=False)
+        assert "_circular reference_" not in result
+        assert result.count("**k:** v") == 2
+
+    def test_circular_reference(self):
+        """Test self-referencing objects render a placeholder"""
+        data = {"name": "loop"}
+        data["self"] = data
+        result = json_to_markdown(data)
+        assert "_circular reference_" in result
+
 
 class TestArrayToMarkdownTable:
     """Tests for array_to_markdown_table function"""
@@ -162,6 +289,29 @@ class TestArrayToMarkdownTable:
         result = array_to_markdown_table(data)
         assert "|" in result
 
+    def test_dense_and_sparse_rows(self):
+        """Test full rows (any key order) and rows missing keys align by column"""
+        data = [
+            {"a": 1, "b": 2, "c": 3},
+            {"c": 6, "a": 4, "b": 5},
+            {"b": 8},
+            {"a": 9, "c": "x|y"},
+        ]
+        result = array_to_markdown_table(data)
+        assert result.split("\n") == [
+            "| a | b | c |",
+            "|---|---|---|",
+            "| 1 | 2 | 3 |",
+            "| 4 | 5 | 6 |",
+            "|  | 8 |  |",
+            "| 9 |  | x\\|y |",
+        ]
+
+    def test_single_column_rows(self):
+        """Test one-column tables, where every row is trivially full"""
+        result = array_to_markdown_table([{"a": 1}, {"a": 2}])
+        assert result == "| a |\n|---|\n| 1 |\n| 2 |"
+
     def test_long_value_truncation(self):
         """Test long values are truncated"""
         long_text = "x" * 100
@@ -170,6 +320,17 @@ class TestArrayToMarkdownTable:
         assert "..." in result
         assert len(long_text) > len(result.split("|")[1].strip())
 
+    def test_long_values_cached_truncated(self):
+        """Test the cell cache is keyed on the truncated text, not the value"""
+        from mcp_ollama_python import response_formatter
+
+        response_formatter._escape_cached.cache_clear()
+        data = [{"v": "x" * 10000 + "a"}, {"v": "x" * 20000 + "b"}]
+        array_to_markdown_table(data)
+        info = response_formatter._escape_cached.cache_info()
+        # header "v" plus one shared truncated cell
+        assert (info.currsize, info.hits) == (2, 1)
+
     def test_various_value_types(self):
         """Test table handles various value types"""
         data = [
@@ -179,35 +340,51 @@ class TestArrayToMarkdownTable:
         assert "|" in result
 
 
-class TestFormatObjectEntry:
-    """Tests for _format_object_entry function"""
+class TestEscapeMarkdown:
+    """Tests for escape_markdown function"""
+
+    def test_special_characters_escaped(self):
+        """Test each Markdown special character is backslash-escaped"""
+        assert escape_markdown("a|b*c_d`e[f]g#h") == "a\\|b\\*c\\_d\\`e\\[f\\]g\\#h"
+
+    def test_backslash_not_double_escaped(self):
+        """Test backslashes are escaped exactly once"""
+        assert escape_markdown("\\*") == "\\\\\\*"
+
+    def test_non_string_coerced(self):
+        """Test non-string input is converted with str()"""
+        assert escape_markdown(42) == "42"
+
+
+class TestObjectEntries:
+    """Tests for key/value lines rendered by format_response"""
 
     def test_simple_value(self):
         """Test formatting simple key-value"""
-        result = _format_object_entry("name", "John", "", set(), 0)
-        assert "**name:**" in result
-        assert "John" in result
+        result = format_response({"name": "John"}, ResponseFormat.MARKDOWN)
+        assert result == "**name:** John"
 
     def test_underscore_key(self):
         """Test underscore replacement in key"""
-        result = _format_object_entry("first_name", "Jane", "", set(), 0)
+        result = format_response({"first_name": "Jane"}, ResponseFormat.MARKDOWN)
         assert "**first name:**" in result
 
     def test_nested_dict_value(self):
         """Test formatting with dict value"""
-        result = _format_object_entry("details", {"inner": "val"}, "", set(), 0)
-        assert "**details:**" in result
-        assert "**inner:**" in result
+        result = format_response(
+            {"details": {"inner": "val"}}, ResponseFormat.MARKDOWN
+        )
+        assert result == "**details:**\n  **inner:** val"
 
     def test_nested_list_value(self):
         """Test formatting with list value"""
-        result = _format_object_entry("items", ["a", "b"], "", set(), 0)
-        assert "**items:**" in result
+        result = format_response({"items": ["a", "b"]}, ResponseFormat.MARKDOWN)
+        assert result == "**items:**\n  - a\n  - b"
 
     def test_with_indent(self):
-        """Test formatting with indent"""
-        result = _format_object_entry("key", "value", "  ", set(), 0)
-        assert result.startswith("  ")
+        """Test nested entries are indented under their parent"""
+        result = format_response({"outer": {"key": "value"}}, ResponseFormat.MARKDOWN)
+        assert result.split("\n")[1].startswith("  **key:**")
 
 
 class TestIntegration:
@@ -7,8 +7,10 @@ import pytest
 from mcp_ollama_python.security import (
     ALLOWED_ENV_VARS,
     is_execute_enabled,
+    is_local_hostname,
     validate_code_payload,
     validate_env_var_key,
+    MODEL_NAME_PATTERN,
     validate_model_name,
     validate_ollama_host,
 )
@@ -43,6 +45,17 @@ class TestValidateOllamaHost:
         with pytest.raises(ValueError, match="path"):
             validate_ollama_host("http://127.0.0.1:11434/api/tags")
 
+    @pytest.mark.parametrize(
+        "hostname",
+        ["localhost", "LOCALHOST", "127.0.0.1", "[::1]", "api.localhost"],
+    )
+    def test_local_hostnames(self, hostname):
+        assert is_local_hostname(hostname)
+
+    @pytest.mark.parametrize("hostname", ["192.168.1.10", "example.com", "[fe80::1]"])
+    def test_non_local_hostnames(self, hostname):
+        assert not is_local_hostname(hostname)
+
 
 class TestExecuteGating:
     def test_execute_disabled_by_default(self, monkeypatch):
@@ -72,6 +85,16 @@ class TestModelAndCodeValidation:
         with pytest.raises(ValueError):
             validate_model_name("../etc/passwd")
 
+    def test_model_name_check_matches_pattern(self):
+        names = ["llama3", "a", "qwen2.5-coder:7b", "_x", "-x", ".x", "a b", "a/b", "modèle", "x\n"]
+        for name in names:
+            expected = MODEL_NAME_PATTERN.match(name.strip()) is not None
+            if expected:
+                assert validate_model_name(name) == name.strip()
+            else:
+                with pytest.raises(ValueError):
+                    validate_model_name(name)
+
     def test_code_null_byte_rejected(self):
         with pytest.raises(ValueError, match="null"):
             validate_code_payload("print('x\x00')")
@@ -287,7 +287,9 @@ class TestHandleResources:
     async def test_read_resource_models(self, mock_ollama_response_list):
         """Test reading the models resource"""
         mock_client = AsyncMock()
-        mock_client.list = AsyncMock(return_value=mock_ollama_response_list)
+        mock_client.list_raw = AsyncMock(
+            return_value=json.dumps(mock_ollama_response_list).encode()
+        )
 
         from mcp_ollama_python.server import OllamaMCPServer
         server = OllamaMCPServer(ollama_client=mock_client)
@@ -0,0 +1,37 @@
+"""
+Tests for scripts/server_control.py - CLI server control
+"""
+
+import subprocess
+from unittest.mock import MagicMock, patch
+
+from mcp_ollama_python.scripts import server_control
+
+
+class TestStartServer:
+    """Tests for start_server"""
+
+    def test_start_keeps_stdin_open(self, tmp_path, monkeypatch):
+        """Test the server keeps its stdin, since EOF there stops it"""
+        monkeypatch.setattr(server_control, "LOGS_DIR", tmp_path)
+        monkeypatch.setattr(server_control, "SERVER_LOG_FILE", tmp_path / "server.log")
+        monkeypatch.setattr(server_control, "_ensure_dirs", lambda: None)
+        monkeypatch.setattr(server_control, "get_server_pid", lambda: None)
+        monkeypatch.setattr(
+            server_control, "cleanup_stale_pipe_files", lambda *args: None
+        )
+        monkeypatch.setattr(server_control, "_claim_pid_file", lambda pid: None)
+        monkeypatch.setattr(server_control, "wait_for_exit", lambda pid, t: False)
+        monkeypatch.setattr(server_control, "_server_proc", None)
+
+        process = MagicMock(pid=12345)
+        process.poll.return_value = None
+
+        with patch.object(
+            server_control.subprocess, "Popen", return_value=process
+        ) as mock_popen:
+            assert server_control.start_server() == 0
+
+        kwargs = mock_popen.call_args.kwargs
+        assert kwargs.get("stdin") not in (subprocess.DEVNULL, subprocess.PIPE)
+        assert kwargs["stdout"] == kwargs["stderr"]